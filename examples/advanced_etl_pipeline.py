@@ -5,6 +5,7 @@ This script demonstrates how to use TaskMasterPy to create a more advanced ETL p
 that extracts data from multiple sources, performs complex transformations,
 and loads the data into different destinations.
 """
+import importlib.util
 import sys
 import os
 import pandas as pd
@@ -23,6 +24,10 @@ from taskmaster.actions.clean_data import DropNAAction, FixDataTypesAction, Filt
 from taskmaster.actions.save_data import SaveCSVAction, SaveJSONAction
 from taskmaster.actions.notify import ConsoleNotifyAction
 
+# Write through Arrow's and orjson's C writers when they are installed
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "pandas"
+JSON_ENGINE = "orjson" if importlib.util.find_spec("orjson") else "pandas"
+
 # Create a sample CSV file for demonstration
 def create_sample_data():
     """Create sample data files for the ETL pipeline."""
@@ -30,20 +35,29 @@ def create_sample_data():
     os.makedirs("data", exist_ok=True)
     
     # Create a sample sales data CSV
-    sales_data = {
-        "date": pd.date_range(start="2023-01-01", periods=100),
-        "product_id": np.random.randint(1, 11, 100),
-        "category": np.random.choice(["Electronics", "Clothing", "Food", "Books"], 100),
-        "quantity": np.random.randint(1, 50, 100),
-        "price": np.random.uniform(10, 1000, 100).round(2),
-        "customer_id": np.random.randint(1, 21, 100)
-    }
+    n_rows = 100
+    rng = np.random.default_rng(42)
     
-    sales_df = pd.DataFrame(sales_data)
+    # Quantity and price carry missing values, so they stay floating point
+    quantity = rng.integers(1, 50, n_rows).astype(np.float32)
+    quantity[rng.choice(n_rows, 10, replace=False)] = np.nan
+    price = rng.uniform(10, 1000, n_rows).round(2)
+    price[rng.choice(n_rows, 5, replace=False)] = np.nan
     
-    # Add some missing values
-    sales_df.loc[np.random.choice(sales_df.index, 10), "quantity"] = np.nan
-    sales_df.loc[np.random.choice(sales_df.index, 5), "price"] = np.nan
+    sales_df = pd.DataFrame(
+        {
+            "date": pd.date_range(start="2023-01-01", periods=n_rows),
+            "product_id": rng.integers(1, 11, n_rows, dtype=np.int16),
+            "category": pd.Categorical.from_codes(
+                rng.integers(0, 4, n_rows, dtype=np.int8),
+                categories=["Electronics", "Clothing", "Food", "Books"]
+            ),
+            "quantity": quantity,
+            "price": price,
+            "customer_id": rng.integers(1, 21, n_rows, dtype=np.int8)
+        },
+        copy=False
+    )
     
     # Save to CSV
     sales_df.to_csv("data/sales_data.csv", index=False)
@@ -102,10 +116,11 @@ def create_etl_pipeline():
         name="Fix Data Types",
         config={
             "column_types": {
-                "product_id": "int",
-                "quantity": "int",
-                "price": "float",
-                "customer_id": "int"
+                "product_id": "int8",
+                "category": "category",
+                "quantity": "int16",
+                "price": "float32",
+                "customer_id": "int8"
             }
         }
     )
@@ -130,13 +145,16 @@ def create_etl_pipeline():
         config={
             "columns": ["category"],
             "method": "onehot",
-            "drop_first": True
+            "drop_first": True,
+            "sparse": True,
+            "dtype": "int8"
         }
     )
     workflow.add_action(encode_action)
     workflow.add_dependency(encode_action, filter_sales_action)
     
-    # Transform 4: Aggregate sales by date and category
+    # Transform 4: Aggregate sales by date and category, from the filtered
+    # sales, since encoding replaces the category column
     aggregate_action = AggregateAction(
         name="Aggregate Sales",
         config={
@@ -149,21 +167,21 @@ def create_etl_pipeline():
         }
     )
     workflow.add_action(aggregate_action)
-    workflow.add_dependency(aggregate_action, encode_action)
+    workflow.add_dependency(aggregate_action, filter_sales_action)
     
-    # Transform 5: Create a pivot table of sales by date and category
+    # Transform 5: Create a pivot table of total sales by date and category
     pivot_action = PivotAction(
         name="Create Sales Pivot",
         config={
             "index": "date",
             "columns": "category",
-            "values": "price_sum",
+            "values": "price",
             "aggfunc": "sum",
             "fill_value": 0
         }
     )
     workflow.add_action(pivot_action)
-    workflow.add_dependency(pivot_action, aggregate_action)
+    workflow.add_dependency(pivot_action, filter_sales_action)
     
     # TRANSFORM PHASE - CUSTOMER DATA
     
@@ -185,7 +203,8 @@ def create_etl_pipeline():
         name="Save Aggregated Sales",
         config={
             "file_path": "./data/aggregated_sales.csv",
-            "index": False
+            "index": False,
+            "engine": CSV_ENGINE
         }
     )
     workflow.add_action(save_agg_action)
@@ -196,7 +215,8 @@ def create_etl_pipeline():
         name="Save Sales Pivot",
         config={
             "file_path": "./data/sales_pivot.csv",
-            "index": True
+            "index": True,
+            "engine": CSV_ENGINE
         }
     )
     workflow.add_action(save_pivot_action)
@@ -208,7 +228,8 @@ def create_etl_pipeline():
         config={
             "file_path": "./data/customers.json",
             "orient": "records",
-            "indent": 2
+            "indent": 2,
+            "engine": JSON_ENGINE
         }
     )
     workflow.add_action(save_customers_action)
@@ -225,9 +246,11 @@ def create_etl_pipeline():
         }
     )
     workflow.add_action(notify_action)
-    workflow.add_dependency(notify_action, save_agg_action)
-    workflow.add_dependency(notify_action, save_pivot_action)
-    workflow.add_dependency(notify_action, save_customers_action)
+    workflow.add_dependencies(notify_action, [
+        save_agg_action,
+        save_pivot_action,
+        save_customers_action
+    ])
     
     return workflow
 
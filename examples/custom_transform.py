@@ -4,11 +4,206 @@ Custom data transformation script for TaskMasterPy.
 This script demonstrates how to create a custom transformation
 that can be called by the RunPythonScriptAction.
 """
+import functools
 import pandas as pd
 import numpy as np
 
 
-def main(df, columns=None, method="log", **kwargs):
+def _column_mins(arr):
+    """Return the NaN-ignoring minimum of each column of a 2D array."""
+    if arr.shape[0] == 0:
+        return np.zeros(arr.shape[1])
+    return np.nanmin(arr, axis=0)
+
+
+def _with_columns(df, new_cols):
+    """Return a shallow copy of a DataFrame with columns added or replaced.
+    
+    Columns that are not in new_cols keep sharing memory with df, so only
+    the new arrays are allocated.
+    """
+    result = df.copy(deep=False)
+    for name, values in new_cols.items():
+        result[name] = values
+    return result
+
+
+def _date_parts(dates):
+    """Split a datetime Series into its calendar components.
+    
+    The components are derived with integer arithmetic on the underlying
+    datetime64 buffer instead of five separate .dt accessors, and are
+    returned as small integer arrays (or float64 with NaN where the input
+    is NaT, matching the .dt accessors).
+    
+    Args:
+        dates: A datetime64 Series
+    
+    Returns:
+        A dictionary mapping component names to NumPy arrays
+    """
+    # Use local wall-clock time for timezone-aware values
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    
+    values = dates.to_numpy(dtype="datetime64[ns]")
+    days = values.astype("datetime64[D]")
+    months = values.astype("datetime64[M]")
+    
+    month = months.astype(np.int64) % 12 + 1
+    parts = {
+        "year": (values.astype("datetime64[Y]").astype(np.int64) + 1970).astype(np.int16),
+        "month": month.astype(np.int8),
+        "day": ((days - months).astype(np.int64) + 1).astype(np.int8),
+        # 1970-01-01 was a Thursday and Monday is day 0
+        "dayofweek": ((days.astype(np.int64) + 3) % 7).astype(np.int8),
+        "quarter": ((month - 1) // 3 + 1).astype(np.int8),
+    }
+    
+    missing = np.isnat(values)
+    if missing.any():
+        for name, part in parts.items():
+            part = part.astype(np.float64)
+            part[missing] = np.nan
+            parts[name] = part
+    
+    return parts
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """Compile the kernels used by the 'numba' engine.
+    
+    Numba is imported here rather than at module level so that callers
+    using the default NumPy engine never have to install or import it.
+    Each kernel works in place on a 2D float64 array, one column per
+    parallel iteration.
+    """
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True)
+    def power(arr, degree):
+        for j in prange(arr.shape[1]):
+            for i in range(arr.shape[0]):
+                arr[i, j] = arr[i, j] ** degree
+    
+    @njit(parallel=True)
+    def shifted_log(arr):
+        for j in prange(arr.shape[1]):
+            # NaN never compares less than the running minimum, so it is skipped
+            col_min = np.inf
+            for i in range(arr.shape[0]):
+                if arr[i, j] < col_min:
+                    col_min = arr[i, j]
+            shift = 1.0 - col_min if col_min <= 0 else 0.0
+            for i in range(arr.shape[0]):
+                arr[i, j] = np.log(arr[i, j] + shift)
+    
+    @njit(parallel=True)
+    def shifted_sqrt(arr):
+        for j in prange(arr.shape[1]):
+            col_min = np.inf
+            for i in range(arr.shape[0]):
+                if arr[i, j] < col_min:
+                    col_min = arr[i, j]
+            shift = -col_min if col_min < 0 else 0.0
+            for i in range(arr.shape[0]):
+                arr[i, j] = np.sqrt(arr[i, j] + shift)
+    
+    @njit(parallel=True)
+    def apply(arr, func):
+        for j in prange(arr.shape[1]):
+            for i in range(arr.shape[0]):
+                arr[i, j] = func(arr[i, j])
+    
+    return {
+        "njit": njit,
+        "power": power,
+        "log": shifted_log,
+        "sqrt": shifted_sqrt,
+        "apply": apply,
+    }
+
+
+def _transform_numba(arr, method, custom_func=None):
+    """Apply a transformation in place using the compiled Numba kernels.
+    
+    Args:
+        arr: A 2D float64 array to transform in place
+        method: Transformation method
+        custom_func: Scalar function for the 'custom' method
+    """
+    kernels = _numba_kernels()
+    
+    if method == "log":
+        kernels["log"](arr)
+    elif method == "sqrt":
+        kernels["sqrt"](arr)
+    elif method == "square":
+        kernels["power"](arr, 2)
+    elif method == "cube":
+        kernels["power"](arr, 3)
+    elif method == "custom":
+        if custom_func is None:
+            raise ValueError("custom_func is required for custom method")
+        # Plain Python functions must be compiled before the kernel can call them
+        if not hasattr(custom_func, "py_func"):
+            custom_func = kernels["njit"](custom_func)
+        kernels["apply"](arr, custom_func)
+    else:
+        raise ValueError(f"Unknown transformation method: {method}")
+
+
+def _log_impl(arr, **kwargs):
+    """Shift columns with non-positive values to avoid log(0), then take the log."""
+    mins = _column_mins(arr)
+    shift = np.where(mins <= 0, 1 - mins, 0.0)
+    np.add(arr, shift, out=arr)
+    return np.log(arr, out=arr)
+
+
+def _sqrt_impl(arr, **kwargs):
+    """Shift columns with negative values so they are non-negative, then take the square root."""
+    mins = _column_mins(arr)
+    shift = np.where(mins < 0, -mins, 0.0)
+    np.add(arr, shift, out=arr)
+    return np.sqrt(arr, out=arr)
+
+
+def _square_impl(arr, **kwargs):
+    """Square the array in place."""
+    return np.multiply(arr, arr, out=arr)
+
+
+def _cube_impl(arr, **kwargs):
+    """Cube the array in place."""
+    squared = arr * arr
+    return np.multiply(squared, arr, out=arr)
+
+
+def _custom_impl(arr, custom_func=None, **kwargs):
+    """Apply a user-supplied scalar function or ufunc to the array."""
+    if custom_func is None:
+        raise ValueError("custom_func is required for custom method")
+    
+    if isinstance(custom_func, np.ufunc):
+        # NumPy ufuncs can be applied to the whole block in place
+        return custom_func(arr, out=arr)
+    return np.frompyfunc(custom_func, 1, 1)(arr).astype(np.float64, copy=False)
+
+
+# NumPy implementations of each method; each takes the whole 2D float64
+# block and returns the transformed block (in place where possible)
+_METHODS = {
+    "log": _log_impl,
+    "sqrt": _sqrt_impl,
+    "square": _square_impl,
+    "cube": _cube_impl,
+    "custom": _custom_impl,
+}
+
+
+def main(df, columns=None, method="log", engine="numpy", **kwargs):
     """Apply a custom transformation to a DataFrame.
     
     Args:
@@ -16,58 +211,39 @@ def main(df, columns=None, method="log", **kwargs):
         columns: List of columns to transform (default: all numeric columns)
         method: Transformation method (default: 'log')
           Options: 'log', 'sqrt', 'square', 'cube', 'custom'
+        engine: Execution engine (default: 'numpy')
+          Options: 'numpy', 'numba' (requires numba to be installed)
         **kwargs: Additional parameters for custom transformations
     
     Returns:
         The transformed DataFrame
     """
-    # Make a copy of the DataFrame
-    result = df.copy()
+    if engine not in ("numpy", "numba"):
+        raise ValueError(f"Unknown engine: {engine}")
+    
+    impl = _METHODS.get(method)
+    if impl is None:
+        raise ValueError(f"Unknown transformation method: {method}")
     
     # If columns is not specified, use all numeric columns
     if columns is None:
-        columns = result.select_dtypes(include=np.number).columns.tolist()
-    
-    # Apply the transformation based on the method
-    if method == "log":
-        for col in columns:
-            # Add a small constant to avoid log(0)
-            min_val = result[col].min()
-            if min_val <= 0:
-                result[col] = np.log(result[col] - min_val + 1)
-            else:
-                result[col] = np.log(result[col])
-    
-    elif method == "sqrt":
-        for col in columns:
-            # Ensure values are non-negative
-            min_val = result[col].min()
-            if min_val < 0:
-                result[col] = np.sqrt(result[col] - min_val)
-            else:
-                result[col] = np.sqrt(result[col])
+        columns = df.select_dtypes(include=np.number).columns.tolist()
     
-    elif method == "square":
-        for col in columns:
-            result[col] = result[col] ** 2
+    if not columns:
+        return df.copy(deep=False)
     
-    elif method == "cube":
-        for col in columns:
-            result[col] = result[col] ** 3
-    
-    elif method == "custom":
-        # Get the custom function from kwargs
-        custom_func = kwargs.get("custom_func")
-        if custom_func is None:
-            raise ValueError("custom_func is required for custom method")
-        
-        for col in columns:
-            result[col] = result[col].apply(custom_func)
+    # Work on a copy of the selected columns as a single float64 block so
+    # each transformation is one vectorized pass instead of one per column
+    arr = df[columns].to_numpy(dtype=np.float64, copy=True)
     
+    # Apply the transformation
+    if engine == "numba":
+        _transform_numba(arr, method, kwargs.get("custom_func"))
     else:
-        raise ValueError(f"Unknown transformation method: {method}")
+        arr = impl(arr, **kwargs)
     
-    return result
+    # Only the transformed columns are new; the rest are shared with df
+    return _with_columns(df, {col: arr[:, j] for j, col in enumerate(columns)})
 
 
 def add_derived_features(df, config=None):
@@ -81,44 +257,62 @@ def add_derived_features(df, config=None):
         The DataFrame with derived features
     """
     config = config or {}
-    result = df.copy()
+    new_cols = {}
     
     # Add interaction terms
-    interaction_terms = config.get("interaction_terms", [])
-    for term in interaction_terms:
-        if len(term) != 2:
-            continue
+    pairs = [
+        tuple(term) for term in config.get("interaction_terms", [])
+        if len(term) == 2 and term[0] in df.columns and term[1] in df.columns
+    ]
+    if pairs:
+        # Read each operand once and multiply all pairs in a single gather
+        operands = list(dict.fromkeys(col for pair in pairs for col in pair))
+        position = {col: i for i, col in enumerate(operands)}
+        block = df[operands].to_numpy()
+        left = [position[col1] for col1, _ in pairs]
+        right = [position[col2] for _, col2 in pairs]
+        products = block[:, left] * block[:, right]
         
-        col1, col2 = term
-        if col1 in result.columns and col2 in result.columns:
-            result[f"{col1}_{col2}_interaction"] = result[col1] * result[col2]
+        for k, (col1, col2) in enumerate(pairs):
+            new_cols[f"{col1}_{col2}_interaction"] = products[:, k]
     
     # Add polynomial features
-    poly_columns = config.get("poly_columns", [])
+    poly_columns = [col for col in config.get("poly_columns", []) if col in df.columns]
     poly_degree = config.get("poly_degree", 2)
     
-    for col in poly_columns:
-        if col in result.columns:
-            for degree in range(2, poly_degree + 1):
-                result[f"{col}_power_{degree}"] = result[col] ** degree
+    if poly_columns:
+        block = df[poly_columns].to_numpy()
+        
+        # Build x^2, x^3, ... incrementally: one multiply per degree
+        # instead of a full np.power evaluation for each one
+        powers = {}
+        current = block
+        for degree in range(2, poly_degree + 1):
+            current = current * block
+            powers[degree] = current
+        
+        for j, col in enumerate(poly_columns):
+            for degree, power in powers.items():
+                new_cols[f"{col}_power_{degree}"] = power[:, j]
     
     # Add date features
     date_columns = config.get("date_columns", [])
     
     for col in date_columns:
-        if col in result.columns:
+        if col in df.columns:
+            dates = df[col]
+            
             # Convert to datetime if not already
-            if not pd.api.types.is_datetime64_dtype(result[col]):
-                result[col] = pd.to_datetime(result[col], errors='coerce')
+            if not pd.api.types.is_datetime64_dtype(dates):
+                dates = pd.to_datetime(dates, errors='coerce')
+                new_cols[col] = dates
             
             # Extract date components
-            result[f"{col}_year"] = result[col].dt.year
-            result[f"{col}_month"] = result[col].dt.month
-            result[f"{col}_day"] = result[col].dt.day
-            result[f"{col}_dayofweek"] = result[col].dt.dayofweek
-            result[f"{col}_quarter"] = result[col].dt.quarter
+            for part, values in _date_parts(dates).items():
+                new_cols[f"{col}_{part}"] = values
     
-    return result
+    # Attach everything at once; the input columns are not copied
+    return _with_columns(df, new_cols)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ setup(
     url="https://github.com/taskmasterpy/taskmasterpy",
     packages=find_packages(),
     install_requires=[
-        "pandas>=1.0.0",
+        "pandas>=1.5.0",
         "numpy>=1.18.0",
         "pyyaml>=5.1",
         "typer>=0.3.0",
@@ -24,7 +24,11 @@ setup(
     ],
     extras_require={
         "excel": ["openpyxl>=3.0.0"],
-        "webhook": ["flask>=2.0.0"],
+        "arrow": ["pyarrow>=8.0.0"],
+        "fast-json": ["orjson>=3.0.0"],
+        "numba": ["numba>=0.56.0"],
+        "polars": ["polars>=1.0.0", "pyarrow>=8.0.0"],
+        "webhook": ["flask>=2.0.0", "waitress>=2.0.0"],
         "win-notify": ["win10toast>=0.9"],
     },
     entry_points={
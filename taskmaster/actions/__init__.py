@@ -6,7 +6,7 @@ This package contains all the action classes for TaskMasterPy.
 
 from taskmaster.actions.base import BaseAction
 from taskmaster.actions.load_data import (
-    LoadDataAction, LoadCSVAction, LoadJSONAction, LoadExcelAction, LoadSQLAction
+    LoadDataAction, LoadCSVAction, LoadJSONAction, LoadExcelAction, LoadParquetAction, LoadSQLAction
 )
 from taskmaster.actions.clean_data import (
     CleanDataAction, DropNAAction, FixDataTypesAction, RenameColumnsAction, FilterRowsAction
@@ -15,7 +15,7 @@ from taskmaster.actions.transform_data import (
     TransformDataAction, NormalizeAction, AggregateAction, PivotAction, EncodeAction
 )
 from taskmaster.actions.save_data import (
-    SaveDataAction, SaveCSVAction, SaveJSONAction, SaveExcelAction, SaveSQLAction
+    SaveDataAction, SaveCSVAction, SaveJSONAction, SaveExcelAction, SaveParquetAction, SaveSQLAction
 )
 from taskmaster.actions.api import CallAPIAction, WebhookAction
 from taskmaster.actions.script import RunScriptAction, RunPythonScriptAction, RunShellScriptAction
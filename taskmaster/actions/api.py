@@ -4,9 +4,17 @@ API-related actions for TaskMasterPy.
 This module defines actions for interacting with APIs, such as making
 HTTP requests or sending webhooks.
 """
+import copy
+import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, Any, Optional, List, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Tuple, Union
 import pandas as pd
 
 from taskmaster.actions.base import BaseAction
@@ -15,6 +23,13 @@ from taskmaster.actions.base import BaseAction
 class CallAPIAction(BaseAction):
     """Action to make HTTP requests to an API endpoint."""
     
+    # Parsed responses shared by all instances, keyed by request digest, as
+    # (expiry time, result) in least recently used order
+    _response_cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    # Maximum number of responses kept in the cache
+    MAX_CACHED_RESPONSES = 128
+    
     def __init__(self, name: str = None, config: Dict[str, Any] = None):
         """Initialize a new call API action.
         
@@ -22,6 +37,12 @@ class CallAPIAction(BaseAction):
             name: A unique name for this action
             config: Configuration parameters for the action
                 - url: The URL to call
+                - urls: A list of URLs to call concurrently with the same settings;
+                  the result is then a list of parsed responses in the same order
+                - concurrency: Maximum number of concurrent requests for urls (default: 8)
+                - retries: How often to retry on 429/5xx responses and connection
+                  errors, with exponential backoff (default: 0)
+                - retry_backoff: Backoff factor in seconds for retries (default: 0.5)
                 - method: The HTTP method to use (default: 'GET')
                 - headers: HTTP headers to include in the request
                 - params: Query parameters to include in the request
@@ -32,9 +53,55 @@ class CallAPIAction(BaseAction):
                 - verify: Whether to verify SSL certificates (default: True)
                 - return_type: How to parse the response (default: 'json')
                   Options: 'json', 'text', 'binary', 'dataframe'
+                - dataframe_engine: How 'dataframe' responses are built (default: 'pandas')
+                  Options: 'pandas', 'pyarrow' (Arrow-backed columns, requires pyarrow)
+                - cache_ttl: Seconds to reuse the parsed response of an identical
+                  request (default: 0, no caching). The cache keeps at most
+                  MAX_CACHED_RESPONSES responses, shared by all instances
         """
         super().__init__(name, config)
     
+    def _cache_key(self) -> bytes:
+        """Build a digest identifying the request described by the config.
+        
+        Returns:
+            The digest of the canonical request
+        """
+        canonical = json.dumps(
+            [
+                self.config.get("method", "GET").upper(),
+                self.config.get("url", ""),
+                self.config.get("urls"),
+                self.config.get("params", {}),
+                self.config.get("headers", {}),
+                self.config.get("data"),
+                self.config.get("json"),
+                self.config.get("auth"),
+                self.config.get("return_type", "json"),
+                self.config.get("dataframe_engine", "pandas"),
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+    
+    @staticmethod
+    def _copy_result(result: Any) -> Any:
+        """Copy a cached result so callers cannot mutate the cache entry.
+        
+        Args:
+            result: The cached result
+            
+        Returns:
+            A copy of the result
+        """
+        if isinstance(result, pd.DataFrame):
+            return result.copy()
+        if isinstance(result, (dict, list)):
+            return copy.deepcopy(result)
+        # str and bytes are immutable
+        return result
+    
     def execute(self, context: Dict[str, Any] = None) -> Any:
         """Execute the action to make an API call.
         
@@ -46,8 +113,93 @@ class CallAPIAction(BaseAction):
         """
         context = context or {}
         
-        # Get parameters from config
+        cache_ttl = self.config.get("cache_ttl", 0)
+        if not cache_ttl:
+            return self._call_api()
+        
+        key = self._cache_key()
+        cache = self._response_cache
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                cache.move_to_end(key)
+            else:
+                entry = None
+        if entry is not None:
+            return self._copy_result(entry[1])
+        
+        result = self._call_api()
+        with self._cache_lock:
+            now = time.monotonic()
+            # Requests with changing params would otherwise leave expired
+            # entries behind forever
+            for expired_key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[expired_key]
+            cache[key] = (now + cache_ttl, result)
+            cache.move_to_end(key)
+            while len(cache) > self.MAX_CACHED_RESPONSES:
+                cache.popitem(last=False)
+        return self._copy_result(result)
+    
+    def _call_api(self) -> Any:
+        """Make the API call described by the config.
+        
+        Returns:
+            The API response parsed according to return_type, or a list of
+            them if urls is configured
+        """
         url = self.config.get("url", "")
+        urls = self.config.get("urls")
+        
+        # Check if URL is provided
+        if not url and not urls:
+            raise ValueError("URL is required")
+        
+        with self._make_session() as session:
+            if not urls:
+                return self._request(session, url)
+            
+            # Overlap the latency of a batch of requests
+            concurrency = self.config.get("concurrency", 8)
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+                return list(executor.map(lambda batch_url: self._request(session, batch_url), urls))
+    
+    def _make_session(self) -> requests.Session:
+        """Create the HTTP session for the configured requests.
+        
+        Returns:
+            A session whose connection pool fits the batch concurrency and which
+            retries rate-limited and failed requests if retries are configured
+        """
+        retries = self.config.get("retries", 0)
+        adapter = HTTPAdapter(
+            pool_maxsize=self.config.get("concurrency", 8),
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=self.config.get("retry_backoff", 0.5),
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False
+            ) if retries else 0
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def _request(self, session: requests.Session, url: str) -> Any:
+        """Make one API request and parse the response.
+        
+        Args:
+            session: The HTTP session to send the request with
+            url: The URL to call
+            
+        Returns:
+            The API response, parsed according to return_type
+        """
+        # Imported here, as taskmaster.utils imports the actions package
+        from taskmaster.utils.serialization import json_loads
+        
+        # Get parameters from config
         method = self.config.get("method", "GET")
         headers = self.config.get("headers", {})
         params = self.config.get("params", {})
@@ -57,13 +209,10 @@ class CallAPIAction(BaseAction):
         timeout = self.config.get("timeout", 30)
         verify = self.config.get("verify", True)
         return_type = self.config.get("return_type", "json")
-        
-        # Check if URL is provided
-        if not url:
-            raise ValueError("URL is required")
+        dataframe_engine = self.config.get("dataframe_engine", "pandas")
         
         # Make the API request
-        response = requests.request(
+        response = session.request(
             method=method,
             url=url,
             headers=headers,
@@ -79,30 +228,65 @@ class CallAPIAction(BaseAction):
         response.raise_for_status()
         
         # Parse the response based on the specified return type
+        # JSON is parsed straight from the response bytes, with orjson if installed
         if return_type == "json":
-            return response.json()
+            return json_loads(response.content)
         elif return_type == "text":
             return response.text
         elif return_type == "binary":
             return response.content
         elif return_type == "dataframe":
+            if dataframe_engine not in ("pandas", "pyarrow"):
+                raise ValueError(f"Unknown DataFrame engine: {dataframe_engine}")
+            
             # Try to parse the response as JSON and convert to DataFrame
             try:
-                json_data = response.json()
+                json_data = json_loads(response.content)
                 if isinstance(json_data, list):
-                    return pd.DataFrame(json_data)
+                    records = json_data
                 elif isinstance(json_data, dict):
                     # If it's a dict with a data key that's a list, use that
                     if "data" in json_data and isinstance(json_data["data"], list):
-                        return pd.DataFrame(json_data["data"])
-                    # Otherwise, try to convert the dict to a DataFrame
-                    return pd.DataFrame([json_data])
+                        records = json_data["data"]
+                    else:
+                        # Otherwise, try to convert the dict to a DataFrame
+                        records = [json_data]
                 else:
                     raise ValueError(f"Cannot convert response to DataFrame: {type(json_data)}")
+                
+                if dataframe_engine == "pyarrow":
+                    return self._records_to_dataframe_pyarrow(records)
+                return pd.DataFrame(records)
+            except ImportError:
+                raise
             except Exception as e:
                 raise ValueError(f"Error converting response to DataFrame: {str(e)}")
         else:
             raise ValueError(f"Unknown return type: {return_type}")
+    
+    @staticmethod
+    def _records_to_dataframe_pyarrow(records: List[Any]) -> pd.DataFrame:
+        """Build a DataFrame from JSON records through an Arrow table.
+        
+        Arrow builds the columns in C++, and the resulting DataFrame keeps
+        them as Arrow-backed columns instead of converting to NumPy.
+        
+        Args:
+            records: The JSON records (a list of dicts)
+            
+        Returns:
+            The records as a pandas DataFrame with ArrowDtype columns
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for dataframe_engine='pyarrow'. "
+                "Install it with 'pip install pyarrow'."
+            )
+        
+        table = pa.Table.from_pylist(records)
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
 
 
 class WebhookAction(BaseAction):
@@ -6,7 +6,7 @@ Actions are the building blocks of workflows and perform specific tasks.
 """
 from abc import ABC, abstractmethod
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List
 
 
 class BaseAction(ABC):
@@ -16,6 +16,10 @@ class BaseAction(ABC):
     All action types should inherit from this class and implement the required methods.
     """
     
+    # Whether the workflow runs this action on its own thread instead of the
+    # worker pool, for actions too cheap to be worth a pool task
+    run_inline = False
+    
     def __init__(self, name: str = None, config: Dict[str, Any] = None):
         """Initialize a new action.
         
@@ -30,6 +34,9 @@ class BaseAction(ABC):
         self.result: Any = None
         self.status = "pending"  # pending, running, completed, failed
         self.error: Optional[Exception] = None
+        # IDs of dependencies whose results no other action reads, set by the
+        # workflow when it lets actions reuse intermediate results
+        self.owned_inputs: FrozenSet[str] = frozenset()
     
     def add_dependency(self, action: 'BaseAction') -> None:
         """Add a dependency to this action.
@@ -39,6 +46,22 @@ class BaseAction(ABC):
         """
         self.dependencies.append(action)
     
+    def owns_input(self, value: Any, context: Dict[str, Any]) -> bool:
+        """Check if an input may be modified in place instead of copied.
+        
+        Args:
+            value: An input taken from the context
+            context: Execution context
+            
+        Returns:
+            True if the value is the result of this action's only dependency,
+            and no other action reads it
+        """
+        if len(self.dependencies) != 1:
+            return False
+        dep_id = self.dependencies[0].id
+        return dep_id in self.owned_inputs and context.get(dep_id) is value
+    
     def can_execute(self) -> bool:
         """Check if this action can be executed.
         
@@ -4,12 +4,48 @@ Data cleaning actions for TaskMasterPy.
 This module defines actions for cleaning data, such as dropping NA values,
 fixing data types, renaming columns, or filtering rows.
 """
+import functools
 from typing import Dict, Any, Optional, List, Union
 import pandas as pd
+import numpy as np
 
 from taskmaster.actions.base import BaseAction
 
 
+@functools.lru_cache(maxsize=None)
+def _numba_valid_count_kernel():
+    """Compile the row validity kernel used by DropNAAction's 'numba' engine.
+
+    Numba is imported here so the default engine never needs it. The kernel
+    is compiled eagerly for its one signature and cached on disk, so later
+    processes load it instead of compiling it again.
+    """
+    try:
+        from numba import njit, prange, types
+    except ImportError:
+        raise ImportError(
+            "numba is required for engine='numba'. "
+            "Install it with 'pip install numba'."
+        )
+
+    # The block is only read, and with copy-on-write pandas hands out
+    # read-only arrays, so the signature takes a read-only array; it accepts
+    # writable ones too
+    @njit(types.int64[:](types.Array(types.float64, 2, "C", readonly=True)), parallel=True, cache=True)
+    def count_valid(arr):
+        counts = np.empty(arr.shape[0], dtype=np.int64)
+        for i in prange(arr.shape[0]):
+            # One pass over the row; NaN is the only value not equal to
+            # itself, so adding the comparison counts values without a branch
+            count = 0
+            for j in range(arr.shape[1]):
+                count += arr[i, j] == arr[i, j]
+            counts[i] = count
+        return counts
+
+    return count_valid
+
+
 class CleanDataAction(BaseAction):
     """Base class for actions that clean data."""
 
@@ -47,6 +83,9 @@ class DropNAAction(CleanDataAction):
                 - how: How to drop NA values (default: 'any')
                 - thresh: Minimum number of non-NA values required
                 - subset: Columns to consider when dropping rows
+                - engine: How rows with NA values are found (default: 'pandas')
+                  Options: 'pandas', 'numba' (requires numba to be installed;
+                  checks all numeric columns of a row in a single pass)
         """
         super().__init__(name, config)
 
@@ -69,19 +108,71 @@ class DropNAAction(CleanDataAction):
         how = self.config.get("how", "any")
         thresh = self.config.get("thresh", None)
         subset = self.config.get("subset", None)
+        engine = self.config.get("engine", "pandas")
+
+        if engine not in ("pandas", "numba"):
+            raise ValueError(f"Unknown DropNA engine: {engine}")
 
         # If columns is specified, only consider those columns
         if columns:
-            df_subset = df[columns]
-            df_cleaned = df[~df_subset.isna().any(axis=1)]
+            options = {"how": "any", "subset": columns}
+        # Drop NA values - only use how if thresh is None
+        elif thresh is not None:
+            options = {"thresh": thresh, "subset": subset}
         else:
-            # Drop NA values - only use how if thresh is None
-            if thresh is not None:
-                df_cleaned = df.dropna(thresh=thresh, subset=subset)
-            else:
-                df_cleaned = df.dropna(how=how, subset=subset)
+            options = {"how": how, "subset": subset}
+
+        if engine == "numba":
+            keep = self._valid_rows_numba(df, **options)
+            # Nothing to drop from an input no other action reads
+            if keep.all() and self.owns_input(df, context):
+                return df
+            return df[keep]
+
+        # An input no other action reads is cleaned in place
+        if self.owns_input(df, context):
+            df.dropna(inplace=True, **options)
+            return df
+
+        return df.dropna(**options)
+
+    def _valid_rows_numba(
+        self,
+        df: pd.DataFrame,
+        subset: Optional[List[str]] = None,
+        how: str = "any",
+        thresh: Optional[int] = None
+    ) -> np.ndarray:
+        """Find the rows to keep, counting the non-NA values of each row.
+
+        Numeric columns are counted by the Numba kernel over one row-major
+        block; any other columns are counted by pandas.
 
-        return df_cleaned
+        Args:
+            df: The input DataFrame
+            subset: Columns to consider (default: all)
+            how: Drop rows with 'any' or with 'all' values NA
+            thresh: Minimum number of non-NA values required, overriding how
+
+        Returns:
+            A boolean mask of the rows to keep
+        """
+        considered = df if subset is None else df[subset]
+        numeric = considered.select_dtypes(include="number")
+        others = [column for column in considered.columns if column not in numeric.columns]
+
+        counts = np.zeros(len(df), dtype=np.int64)
+        if numeric.shape[1]:
+            block = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+            counts += _numba_valid_count_kernel()(block)
+        if others:
+            counts += considered[others].notna().sum(axis=1).to_numpy()
+
+        if thresh is not None:
+            return counts >= thresh
+        if how == "all":
+            return counts > 0
+        return counts == considered.shape[1]
 
     def _get_input_dataframe(self, context: Dict[str, Any]) -> pd.DataFrame:
         """Get the input DataFrame from the context.
@@ -99,13 +190,20 @@ class DropNAAction(CleanDataAction):
             # Use the specified input key
             df = context[input_key]
         else:
-            # Try to find a DataFrame in the context
-            for key, value in context.items():
-                if isinstance(value, pd.DataFrame):
-                    df = value
+            # Otherwise, try to find a DataFrame in the context
+            # First, check if any of our dependencies produced a DataFrame
+            for dep in self.dependencies:
+                if dep.id in context and isinstance(context[dep.id], pd.DataFrame):
+                    df = context[dep.id]
                     break
             else:
-                raise ValueError("No DataFrame found in context")
+                # If no dependency has a DataFrame, look for any DataFrame in the context
+                for key, value in context.items():
+                    if isinstance(value, pd.DataFrame):
+                        df = value
+                        break
+                else:
+                    raise ValueError("No DataFrame found in context")
 
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected a DataFrame, got {type(df)}")
@@ -122,7 +220,9 @@ class FixDataTypesAction(CleanDataAction):
         Args:
             name: A unique name for this action
             config: Configuration parameters for the action
-                - column_types: Dictionary mapping column names to data types
+                - column_types: Dictionary mapping column names to data types.
+                  Any pandas dtype is accepted; 'category' stores repeated
+                  strings as integer codes, which group and compare faster
                 - infer_types: Whether to infer data types (default: False)
         """
         super().__init__(name, config)
@@ -146,12 +246,15 @@ class FixDataTypesAction(CleanDataAction):
         infer_types = self.config.get("infer_types", False)
 
         # Make a copy of the DataFrame
-        df_cleaned = df.copy()
+        df_cleaned = df if self.owns_input(df, context) else df.copy()
 
         # Fix data types
         if column_types:
             for column, dtype in column_types.items():
                 if column in df_cleaned.columns:
+                    # Columns loaded as categoricals are already converted
+                    if dtype == "category" and isinstance(df_cleaned[column].dtype, pd.CategoricalDtype):
+                        continue
                     try:
                         df_cleaned[column] = df_cleaned[column].astype(dtype)
                     except Exception as e:
@@ -189,13 +292,20 @@ class FixDataTypesAction(CleanDataAction):
             # Use the specified input key
             df = context[input_key]
         else:
-            # Try to find a DataFrame in the context
-            for key, value in context.items():
-                if isinstance(value, pd.DataFrame):
-                    df = value
+            # Otherwise, try to find a DataFrame in the context
+            # First, check if any of our dependencies produced a DataFrame
+            for dep in self.dependencies:
+                if dep.id in context and isinstance(context[dep.id], pd.DataFrame):
+                    df = context[dep.id]
                     break
             else:
-                raise ValueError("No DataFrame found in context")
+                # If no dependency has a DataFrame, look for any DataFrame in the context
+                for key, value in context.items():
+                    if isinstance(value, pd.DataFrame):
+                        df = value
+                        break
+                else:
+                    raise ValueError("No DataFrame found in context")
 
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected a DataFrame, got {type(df)}")
@@ -254,13 +364,20 @@ class RenameColumnsAction(CleanDataAction):
             # Use the specified input key
             df = context[input_key]
         else:
-            # Try to find a DataFrame in the context
-            for key, value in context.items():
-                if isinstance(value, pd.DataFrame):
-                    df = value
+            # Otherwise, try to find a DataFrame in the context
+            # First, check if any of our dependencies produced a DataFrame
+            for dep in self.dependencies:
+                if dep.id in context and isinstance(context[dep.id], pd.DataFrame):
+                    df = context[dep.id]
                     break
             else:
-                raise ValueError("No DataFrame found in context")
+                # If no dependency has a DataFrame, look for any DataFrame in the context
+                for key, value in context.items():
+                    if isinstance(value, pd.DataFrame):
+                        df = value
+                        break
+                else:
+                    raise ValueError("No DataFrame found in context")
 
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected a DataFrame, got {type(df)}")
@@ -303,7 +420,7 @@ class FilterRowsAction(CleanDataAction):
         filters = self.config.get("filters", [])
 
         # Apply filters
-        df_filtered = df.copy()
+        df_filtered = df if self.owns_input(df, context) else df.copy()
 
         for filter_condition in filters:
             column = filter_condition.get("column")
@@ -351,13 +468,20 @@ class FilterRowsAction(CleanDataAction):
             # Use the specified input key
             df = context[input_key]
         else:
-            # Try to find a DataFrame in the context
-            for key, value in context.items():
-                if isinstance(value, pd.DataFrame):
-                    df = value
+            # Otherwise, try to find a DataFrame in the context
+            # First, check if any of our dependencies produced a DataFrame
+            for dep in self.dependencies:
+                if dep.id in context and isinstance(context[dep.id], pd.DataFrame):
+                    df = context[dep.id]
                     break
             else:
-                raise ValueError("No DataFrame found in context")
+                # If no dependency has a DataFrame, look for any DataFrame in the context
+                for key, value in context.items():
+                    if isinstance(value, pd.DataFrame):
+                        df = value
+                        break
+                else:
+                    raise ValueError("No DataFrame found in context")
 
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected a DataFrame, got {type(df)}")
@@ -3,12 +3,17 @@ Email actions for TaskMasterPy.
 
 This module defines actions for sending email notifications.
 """
+import atexit
+import base64
+import hashlib
+import mmap
 import os
 import smtplib
+import threading
+from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 from taskmaster.actions.base import BaseAction
 
@@ -16,6 +21,11 @@ from taskmaster.actions.base import BaseAction
 class SendEmailAction(BaseAction):
     """Action to send an email notification."""
     
+    # Idle SMTP connections keyed by (server, port, use_tls, username,
+    # password digest), so a changed password opens a new login
+    _smtp_pool: Dict[Tuple[str, int, bool, str, str], List[smtplib.SMTP]] = {}
+    _pool_lock = threading.Lock()
+    
     def __init__(self, name: str = None, config: Dict[str, Any] = None):
         """Initialize a new send email action.
         
@@ -99,27 +109,22 @@ class SendEmailAction(BaseAction):
             # Add attachments
             for attachment in attachments:
                 if os.path.exists(attachment):
-                    with open(attachment, "rb") as f:
-                        part = MIMEApplication(f.read(), Name=os.path.basename(attachment))
-                    
+                    part = self._build_attachment(attachment)
                     part["Content-Disposition"] = f'attachment; filename="{os.path.basename(attachment)}"'
                     msg.attach(part)
             
-            # Connect to the SMTP server
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            if use_tls:
-                server.starttls()
-            
-            # Login if credentials are provided
-            if username and password:
-                server.login(username, password)
-            
-            # Send the email
+            # Send the email over a pooled connection
             all_recipients = to_email + cc_email + bcc_email
-            server.sendmail(from_email, all_recipients, msg.as_string())
-            
-            # Close the connection
-            server.quit()
+            password_digest = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+            key = (smtp_server, smtp_port, use_tls, username, password_digest)
+            server = self._checkout_connection(key, password)
+            try:
+                server.sendmail(from_email, all_recipients, msg.as_string())
+            except (smtplib.SMTPException, OSError):
+                # Don't hand a broken connection to the next sender
+                self._close_connection(server)
+                raise
+            self._return_connection(key, server)
             
             return True
         
@@ -127,3 +132,107 @@ class SendEmailAction(BaseAction):
             print(f"Error sending email: {str(e)}")
             self.error = e
             return False
+    
+    def _build_attachment(self, file_path: str) -> MIMEBase:
+        """Build a base64-encoded MIME part for a file.
+        
+        The file is memory-mapped and encoded straight from the mapping, so
+        the raw contents are never copied into a Python bytes object.
+        
+        Args:
+            file_path: Path to the file to attach
+            
+        Returns:
+            The MIME part for the attachment
+        """
+        part = MIMEBase("application", "octet-stream", Name=os.path.basename(file_path))
+        
+        with open(file_path, "rb") as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    payload = base64.encodebytes(mapped).decode("ascii")
+            else:
+                payload = ""
+        
+        part.set_payload(payload)
+        part["Content-Transfer-Encoding"] = "base64"
+        return part
+    
+    @classmethod
+    def _checkout_connection(cls, key: Tuple[str, int, bool, str, str], password: str) -> smtplib.SMTP:
+        """Take an open SMTP connection out of the pool, connecting if needed.
+        
+        Only taking the connection out holds the pool lock, so senders don't
+        wait on each other's network round trips.
+        
+        Args:
+            key: The (server, port, use_tls, username, password digest) tuple
+            password: SMTP password
+            
+        Returns:
+            An open, authenticated SMTP connection, to be handed back with
+            _return_connection
+        """
+        while True:
+            with cls._pool_lock:
+                idle = cls._smtp_pool.get(key)
+                server = idle.pop() if idle else None
+            if server is None:
+                break
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            cls._close_connection(server)
+        
+        smtp_server, smtp_port, use_tls, username, _ = key
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        try:
+            if use_tls:
+                server.starttls()
+            
+            # Login if credentials are provided
+            if username and password:
+                server.login(username, password)
+        except (smtplib.SMTPException, OSError):
+            cls._close_connection(server)
+            raise
+        
+        return server
+    
+    @classmethod
+    def _return_connection(cls, key: Tuple[str, int, bool, str, str], server: smtplib.SMTP) -> None:
+        """Put a connection back in the pool for the next sender.
+        
+        Args:
+            key: The (server, port, use_tls, username, password digest) tuple
+            server: The connection taken out with _checkout_connection
+        """
+        with cls._pool_lock:
+            cls._smtp_pool.setdefault(key, []).append(server)
+    
+    @staticmethod
+    def _close_connection(server: smtplib.SMTP) -> None:
+        """Close an SMTP connection, ignoring errors.
+        
+        Args:
+            server: The connection to close
+        """
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    @classmethod
+    def close_connections(cls) -> None:
+        """Close all idle pooled SMTP connections."""
+        with cls._pool_lock:
+            servers = [server for idle in cls._smtp_pool.values() for server in idle]
+            cls._smtp_pool.clear()
+        for server in servers:
+            cls._close_connection(server)
+
+
+atexit.register(SendEmailAction.close_connections)
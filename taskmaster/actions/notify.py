@@ -38,6 +38,8 @@ class NotifyAction(BaseAction):
 class ConsoleNotifyAction(NotifyAction):
     """Action to send a notification to the console."""
     
+    run_inline = True
+    
     def __init__(self, name: str = None, config: Dict[str, Any] = None):
         """Initialize a new console notify action.
         
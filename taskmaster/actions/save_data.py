@@ -52,13 +52,20 @@ class SaveDataAction(BaseAction):
             # Use the specified input key
             df = context[input_key]
         else:
-            # Try to find a DataFrame in the context
-            for key, value in context.items():
-                if isinstance(value, pd.DataFrame):
-                    df = value
+            # Otherwise, try to find a DataFrame in the context
+            # First, check if any of our dependencies produced a DataFrame
+            for dep in self.dependencies:
+                if dep.id in context and isinstance(context[dep.id], pd.DataFrame):
+                    df = context[dep.id]
                     break
             else:
-                raise ValueError("No DataFrame found in context")
+                # If no dependency has a DataFrame, look for any DataFrame in the context
+                for key, value in context.items():
+                    if isinstance(value, pd.DataFrame):
+                        df = value
+                        break
+                else:
+                    raise ValueError("No DataFrame found in context")
         
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected a DataFrame, got {type(df)}")
@@ -80,6 +87,10 @@ class SaveCSVAction(SaveDataAction):
                 - header: Whether to include the header (default: True)
                 - delimiter: Field delimiter (default: ',')
                 - encoding: File encoding (default: 'utf-8')
+                - engine: CSV writer to use (default: 'pandas')
+                  Options: 'pandas', 'pyarrow' (multithreaded, UTF-8 only;
+                  quotes every string and writes whole floats without a
+                  decimal point, so such columns read back as integers)
         """
         super().__init__(name, config)
     
@@ -103,20 +114,71 @@ class SaveCSVAction(SaveDataAction):
         header = self.config.get("header", True)
         delimiter = self.config.get("delimiter", ",")
         encoding = self.config.get("encoding", "utf-8")
+        engine = self.config.get("engine", "pandas")
         
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
         
         # Save the DataFrame to CSV
-        df.to_csv(
-            file_path,
-            index=index,
-            header=header,
-            sep=delimiter,
-            encoding=encoding
-        )
+        if engine == "pyarrow":
+            self._write_csv_pyarrow(df, file_path, index, header, delimiter, encoding)
+        elif engine == "pandas":
+            df.to_csv(
+                file_path,
+                index=index,
+                header=header,
+                sep=delimiter,
+                encoding=encoding
+            )
+        else:
+            raise ValueError(f"Unknown CSV engine: {engine}")
         
         return file_path
+    
+    def _write_csv_pyarrow(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        index: bool,
+        header: bool,
+        delimiter: str,
+        encoding: str
+    ) -> None:
+        """Write a DataFrame to CSV using PyArrow's C++ writer.
+        
+        Args:
+            df: The DataFrame to save
+            file_path: Path to the CSV file
+            index: Whether to include the index
+            header: Whether to include the header
+            delimiter: Field delimiter
+            encoding: File encoding (must be UTF-8)
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for engine='pyarrow'. "
+                "Install it with 'pip install pyarrow'."
+            )
+        
+        if encoding.lower().replace("-", "") != "utf8":
+            raise ValueError(f"The pyarrow CSV engine only writes UTF-8, got encoding {encoding}")
+        
+        if index:
+            # pandas writes the index first, with an empty header for unnamed
+            # levels; Arrow would append it as the last column
+            df = df.rename_axis(
+                [name if name is not None else "" for name in df.index.names]
+            ).reset_index()
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(
+            table,
+            file_path,
+            write_options=pa_csv.WriteOptions(include_header=header, delimiter=delimiter)
+        )
 
 
 class SaveJSONAction(SaveDataAction):
@@ -132,6 +194,9 @@ class SaveJSONAction(SaveDataAction):
                 - orient: Format of the JSON data (default: 'records')
                 - indent: Number of spaces for indentation (default: 2)
                 - encoding: File encoding (default: 'utf-8')
+                - engine: JSON writer to use (default: 'pandas')
+                  Options: 'pandas', 'orjson' (UTF-8 only, indents by 2 spaces
+                  if indent is set, writes dates as ISO 8601 strings)
         """
         super().__init__(name, config)
     
@@ -154,19 +219,91 @@ class SaveJSONAction(SaveDataAction):
         orient = self.config.get("orient", "records")
         indent = self.config.get("indent", 2)
         encoding = self.config.get("encoding", "utf-8")
+        engine = self.config.get("engine", "pandas")
         
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
         
         # Save the DataFrame to JSON
-        df.to_json(
-            file_path,
-            orient=orient,
-            indent=indent,
-            force_ascii=False
-        )
+        if engine == "orjson":
+            self._write_json_orjson(df, file_path, orient, indent, encoding)
+        elif engine == "pandas":
+            df.to_json(
+                file_path,
+                orient=orient,
+                indent=indent,
+                force_ascii=False
+            )
+        else:
+            raise ValueError(f"Unknown JSON engine: {engine}")
         
         return file_path
+    
+    def _write_json_orjson(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        orient: str,
+        indent: Optional[int],
+        encoding: str
+    ) -> None:
+        """Write a DataFrame to JSON using orjson.
+        
+        Args:
+            df: The DataFrame to save
+            file_path: Path to the JSON file
+            orient: Format of the JSON data
+            indent: Number of spaces for indentation (orjson only supports 2)
+            encoding: File encoding (must be UTF-8)
+        """
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "orjson is required for engine='orjson'. "
+                "Install it with 'pip install orjson'."
+            )
+        
+        if encoding.lower().replace("-", "") != "utf8":
+            raise ValueError(f"The orjson JSON engine only writes UTF-8, got encoding {encoding}")
+        
+        # DataFrame.to_dict spells pandas' default JSON orient 'dict'
+        dict_orient = {"columns": "dict"}.get(orient, orient)
+        if dict_orient not in ("dict", "records", "index", "split"):
+            raise ValueError(f"The orjson JSON engine doesn't support orient {orient}")
+        
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        
+        def default(obj: Any) -> Any:
+            # pandas scalars orjson doesn't know natively
+            if isinstance(obj, pd.Timestamp):
+                return obj.isoformat()
+            if obj is pd.NaT or obj is pd.NA:
+                return None
+            raise TypeError
+        
+        if dict_orient != "split":
+            # Like pandas, write MultiIndex labels (e.g. from AggregateAction)
+            # as the string of their tuple, since orjson can't use tuple keys
+            if isinstance(df.columns, pd.MultiIndex):
+                df = df.set_axis([str(column) for column in df.columns], axis=1)
+            if isinstance(df.index, pd.MultiIndex):
+                df = df.set_axis([str(label) for label in df.index], axis=0)
+        
+        if dict_orient == "records" and len(df.columns) and all(
+            isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes
+        ):
+            # Arrow-backed frames (e.g. from CallAPIAction's pyarrow engine) are
+            # read straight from their Arrow buffers instead of boxed by pandas
+            import pyarrow as pa
+            data = pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+        else:
+            data = df.to_dict(orient=dict_orient)
+        
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, default=default, option=option))
 
 
 class SaveExcelAction(SaveDataAction):
@@ -219,6 +356,56 @@ class SaveExcelAction(SaveDataAction):
         return file_path
 
 
+class SaveParquetAction(SaveDataAction):
+    """Action to save data to a Parquet file."""
+    
+    def __init__(self, name: str = None, config: Dict[str, Any] = None):
+        """Initialize a new save Parquet action.
+        
+        Args:
+            name: A unique name for this action
+            config: Configuration parameters for the action
+                - file_path: Path to the Parquet file
+                - index: Whether to include the index (default: False)
+                - compression: Compression codec (default: 'zstd')
+                - engine: Parquet library to use (default: 'pyarrow')
+        """
+        super().__init__(name, config)
+    
+    def execute(self, context: Dict[str, Any] = None) -> str:
+        """Execute the action to save data to a Parquet file.
+        
+        Args:
+            context: Execution context, must contain a DataFrame
+            
+        Returns:
+            The path where the data was saved
+        """
+        context = context or {}
+        
+        # Get the input DataFrame
+        df = self._get_input_dataframe(context)
+        
+        # Get parameters from config
+        file_path = self.config.get("file_path", "")
+        index = self.config.get("index", False)
+        compression = self.config.get("compression", "zstd")
+        engine = self.config.get("engine", "pyarrow")
+        
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        
+        # Save the DataFrame to Parquet
+        df.to_parquet(
+            file_path,
+            engine=engine,
+            compression=compression,
+            index=index
+        )
+        
+        return file_path
+
+
 class SaveSQLAction(SaveDataAction):
     """Action to save data to a SQL database."""
     
@@ -4,12 +4,14 @@ Script execution actions for TaskMasterPy.
 This module defines actions for running custom scripts, such as
 Python scripts or shell scripts.
 """
+import io
 import os
+import shlex
 import sys
 import subprocess
 import importlib.util
-from typing import Dict, Any, Optional, List, Union
-import pandas as pd
+from types import ModuleType
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 from taskmaster.actions.base import BaseAction
 
@@ -41,6 +43,10 @@ class RunScriptAction(BaseAction):
 class RunPythonScriptAction(RunScriptAction):
     """Action to run a Python script."""
     
+    # Loaded script modules, keyed by absolute path and storing the
+    # modification time they were loaded at
+    _module_cache: Dict[str, Tuple[int, ModuleType]] = {}
+    
     def __init__(self, name: str = None, config: Dict[str, Any] = None):
         """Initialize a new run Python script action.
         
@@ -84,12 +90,7 @@ class RunPythonScriptAction(RunScriptAction):
             raise FileNotFoundError(f"Script file not found: {script_path}")
         
         # Load the script module
-        spec = importlib.util.spec_from_file_location("script_module", script_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load script: {script_path}")
-        
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = self._load_module(script_path)
         
         # Check if the function exists in the module
         if not hasattr(module, function_name):
@@ -109,9 +110,13 @@ class RunPythonScriptAction(RunScriptAction):
         # Call the function
         result = func(*call_args, **call_kwargs)
         
-        # Convert to DataFrame if requested
-        if return_dataframe and not isinstance(result, pd.DataFrame):
-            if isinstance(result, dict):
+        # Convert to DataFrame if requested (pandas is only imported when needed)
+        if return_dataframe:
+            import pandas as pd
+            
+            if isinstance(result, pd.DataFrame):
+                pass
+            elif isinstance(result, dict):
                 result = pd.DataFrame([result])
             elif isinstance(result, list):
                 result = pd.DataFrame(result)
@@ -119,6 +124,33 @@ class RunPythonScriptAction(RunScriptAction):
                 raise TypeError(f"Cannot convert result to DataFrame: {type(result)}")
         
         return result
+    
+    @classmethod
+    def _load_module(cls, script_path: str) -> ModuleType:
+        """Load a script as a module, reusing it if the file is unchanged.
+        
+        Args:
+            script_path: Path to the Python script file
+            
+        Returns:
+            The loaded module
+        """
+        abs_path = os.path.abspath(script_path)
+        mtime = os.stat(abs_path).st_mtime_ns
+        
+        cached = cls._module_cache.get(abs_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        spec = importlib.util.spec_from_file_location("script_module", abs_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load script: {script_path}")
+        
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        cls._module_cache[abs_path] = (mtime, module)
+        return module
 
 
 class RunShellScriptAction(RunScriptAction):
@@ -132,7 +164,7 @@ class RunShellScriptAction(RunScriptAction):
             config: Configuration parameters for the action
                 - script_path: Path to the shell script file
                 - args: Arguments to pass to the script
-                - shell: Whether to run the command through the shell (default: True)
+                - shell: Whether to run the command through the shell (default: False)
                 - cwd: Working directory for the command
                 - env: Environment variables for the command
                 - timeout: Timeout in seconds (default: 60)
@@ -140,6 +172,12 @@ class RunShellScriptAction(RunScriptAction):
                 - check: Whether to check the return code (default: True)
                 - return_stdout: Whether to return stdout as a string (default: True)
                 - return_dataframe: Whether to parse stdout as CSV and return a DataFrame (default: False)
+                - csv_engine: CSV parser used with return_dataframe (default: pandas default)
+                  Options: 'c', 'python', 'pyarrow' (multithreaded Arrow reader)
+                - delimiter: Field delimiter used with return_dataframe (default: ',')
+                - arrow_dtypes: Whether the 'pyarrow' engine returns Arrow-backed
+                  columns instead of NumPy ones (default: False)
+                - encoding: Encoding used to decode stdout/stderr (default: 'utf-8')
         """
         super().__init__(name, config)
     
@@ -157,7 +195,7 @@ class RunShellScriptAction(RunScriptAction):
         # Get parameters from config
         script_path = self.config.get("script_path", "")
         args = self.config.get("args", [])
-        shell = self.config.get("shell", True)
+        shell = self.config.get("shell", False)
         cwd = self.config.get("cwd")
         env = self.config.get("env")
         timeout = self.config.get("timeout", 60)
@@ -165,6 +203,10 @@ class RunShellScriptAction(RunScriptAction):
         check = self.config.get("check", True)
         return_stdout = self.config.get("return_stdout", True)
         return_dataframe = self.config.get("return_dataframe", False)
+        csv_engine = self.config.get("csv_engine")
+        delimiter = self.config.get("delimiter", ",")
+        arrow_dtypes = self.config.get("arrow_dtypes", False)
+        encoding = self.config.get("encoding", "utf-8")
         
         # Check if script path is provided
         if not script_path:
@@ -174,10 +216,13 @@ class RunShellScriptAction(RunScriptAction):
         if not os.path.exists(script_path):
             raise FileNotFoundError(f"Script file not found: {script_path}")
         
-        # Prepare the command
-        command = [script_path] + args
+        # Prepare the command. Without a shell the script is exec'd directly;
+        # a shell needs the arguments quoted into a single command line.
+        command = [script_path] + [str(arg) for arg in args]
+        if shell:
+            command = " ".join(shlex.quote(part) for part in command)
         
-        # Run the command
+        # Run the command, keeping the output as bytes
         result = subprocess.run(
             command,
             shell=shell,
@@ -185,21 +230,61 @@ class RunShellScriptAction(RunScriptAction):
             env=env,
             timeout=timeout,
             capture_output=capture_output,
-            check=check,
-            text=True
+            check=check
         )
         
         # Process the result
         if return_dataframe:
-            # Parse stdout as CSV and return a DataFrame
-            return pd.read_csv(pd.StringIO(result.stdout))
-        elif return_stdout:
+            # Parse stdout as CSV straight from the captured bytes
+            if csv_engine == "pyarrow":
+                return self._read_csv_pyarrow(result.stdout, delimiter, encoding, arrow_dtypes)
+            
+            import pandas as pd
+            
+            return pd.read_csv(
+                io.BytesIO(result.stdout),
+                engine=csv_engine,
+                sep=delimiter,
+                encoding=encoding
+            )
+        
+        stdout = result.stdout.decode(encoding) if result.stdout is not None else None
+        if return_stdout:
             # Return stdout as a string
-            return result.stdout
+            return stdout
         else:
             # Return the CompletedProcess object
             return {
                 "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr
+                "stdout": stdout,
+                "stderr": result.stderr.decode(encoding) if result.stderr is not None else None
             }
+    
+    def _read_csv_pyarrow(self, data: bytes, delimiter: str, encoding: str, arrow_dtypes: bool) -> Any:
+        """Parse CSV bytes with PyArrow's multithreaded reader.
+        
+        Args:
+            data: The CSV data
+            delimiter: Field delimiter
+            encoding: Encoding of the data
+            arrow_dtypes: Whether to keep Arrow-backed columns
+            
+        Returns:
+            The parsed data as a pandas DataFrame
+        """
+        import pandas as pd
+        
+        try:
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for csv_engine='pyarrow'. "
+                "Install it with 'pip install pyarrow'."
+            )
+        
+        table = pa_csv.read_csv(
+            io.BytesIO(data),
+            read_options=pa_csv.ReadOptions(use_threads=True, encoding=encoding),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter)
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype if arrow_dtypes else None)
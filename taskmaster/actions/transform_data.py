@@ -4,6 +4,7 @@ Data transformation actions for TaskMasterPy.
 This module defines actions for transforming data, such as normalizing,
 aggregating, grouping, pivoting, or encoding.
 """
+import functools
 from typing import Dict, Any, Optional, List, Union
 import pandas as pd
 import numpy as np
@@ -12,6 +13,43 @@ from sklearn.preprocessing import StandardScaler, MinMaxScaler, OneHotEncoder, L
 from taskmaster.actions.base import BaseAction
 
 
+@functools.lru_cache(maxsize=None)
+def _numba_minmax_kernel():
+    """Compile the min-max kernel used by NormalizeAction's 'numba' engine.
+    
+    Numba is imported here so the default engine never needs it. The kernel
+    is compiled eagerly for its one signature and cached on disk, so later
+    processes load it instead of compiling it again.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        raise ImportError(
+            "numba is required for engine='numba'. "
+            "Install it with 'pip install numba'."
+        )
+    
+    @njit("void(float64[::1, :])", parallel=True, cache=True)
+    def minmax(arr):
+        for j in prange(arr.shape[1]):
+            # NaN never compares less or greater, so it is skipped like in sklearn
+            col_min = np.inf
+            col_max = -np.inf
+            for i in range(arr.shape[0]):
+                if arr[i, j] < col_min:
+                    col_min = arr[i, j]
+                if arr[i, j] > col_max:
+                    col_max = arr[i, j]
+            # Constant columns map to 0, as MinMaxScaler does
+            col_range = col_max - col_min
+            if not col_range > 0:
+                col_range = 1.0
+            for i in range(arr.shape[0]):
+                arr[i, j] = (arr[i, j] - col_min) / col_range
+    
+    return minmax
+
+
 class TransformDataAction(BaseAction):
     """Base class for actions that transform data."""
     
@@ -85,6 +123,8 @@ class NormalizeAction(TransformDataAction):
                 - method: Normalization method (default: 'zscore')
                   Options: 'zscore', 'minmax', 'robust', 'log'
                 - inplace: Whether to modify the original DataFrame (default: False)
+                - engine: Implementation of the 'minmax' method (default: 'sklearn')
+                  Options: 'sklearn', 'numba' (requires numba to be installed)
         """
         super().__init__(name, config)
     
@@ -106,9 +146,13 @@ class NormalizeAction(TransformDataAction):
         columns = self.config.get("columns")
         method = self.config.get("method", "zscore")
         inplace = self.config.get("inplace", False)
+        engine = self.config.get("engine", "sklearn")
+        
+        if engine not in ("sklearn", "numba"):
+            raise ValueError(f"Unknown normalization engine: {engine}")
         
         # Make a copy of the DataFrame if not inplace
-        if not inplace:
+        if not inplace and not self.owns_input(df, context):
             df = df.copy()
         
         # If columns is not specified, use all numeric columns
@@ -128,28 +172,35 @@ class NormalizeAction(TransformDataAction):
         
         elif method == "minmax":
             # Min-max normalization (range [0, 1])
-            scaler = MinMaxScaler()
-            df[columns] = scaler.fit_transform(df[columns])
+            if engine == "numba":
+                block = np.array(df[columns], dtype=np.float64, order="F")
+                _numba_minmax_kernel()(block)
+                df[columns] = block
+            else:
+                scaler = MinMaxScaler()
+                df[columns] = scaler.fit_transform(df[columns])
         
         elif method == "robust":
-            # Robust normalization (median=0, IQR=1)
-            for col in columns:
-                median = df[col].median()
-                q1 = df[col].quantile(0.25)
-                q3 = df[col].quantile(0.75)
-                iqr = q3 - q1
-                if iqr > 0:
-                    df[col] = (df[col] - median) / iqr
+            # Robust normalization (median=0, IQR=1), skipping constant columns
+            quartiles = df[columns].quantile([0.25, 0.5, 0.75])
+            iqr = quartiles.loc[0.75] - quartiles.loc[0.25]
+            scaled = iqr.index[iqr > 0].tolist()
+            if scaled:
+                # Scale all columns at once on a single float block
+                block = df[scaled].to_numpy(dtype=np.float64, copy=True)
+                np.subtract(block, quartiles.loc[0.5, scaled].to_numpy(dtype=np.float64), out=block)
+                np.divide(block, iqr[scaled].to_numpy(dtype=np.float64), out=block)
+                df[scaled] = block
         
         elif method == "log":
             # Log normalization
-            for col in columns:
-                # Add a small constant to avoid log(0)
-                min_val = df[col].min()
-                if min_val <= 0:
-                    df[col] = np.log(df[col] - min_val + 1)
-                else:
-                    df[col] = np.log(df[col])
+            if columns:
+                # Shift columns with non-positive values to start at 1 to avoid log(0)
+                min_vals = df[columns].min().to_numpy(dtype=np.float64)
+                block = df[columns].to_numpy(dtype=np.float64, copy=True)
+                np.add(block, np.where(min_vals <= 0, 1 - min_vals, 0), out=block)
+                np.log(block, out=block)
+                df[columns] = block
         
         else:
             raise ValueError(f"Unknown normalization method: {method}")
@@ -170,6 +221,10 @@ class AggregateAction(TransformDataAction):
                 - aggregations: Dictionary mapping columns to aggregation functions
                   Example: {"sales": "sum", "price": ["mean", "max"]}
                 - reset_index: Whether to reset the index (default: True)
+                - engine: Group-by implementation (default: 'pandas')
+                  Options: 'pandas', 'polars' (requires polars and pyarrow; runs
+                  the aggregations in parallel and supports mean, sum, min, max,
+                  std, var, median, count, nunique, first and last)
         """
         super().__init__(name, config)
     
@@ -191,6 +246,7 @@ class AggregateAction(TransformDataAction):
         group_by = self.config.get("group_by")
         aggregations = self.config.get("aggregations", {})
         reset_index = self.config.get("reset_index", True)
+        engine = self.config.get("engine", "pandas")
         
         if not group_by:
             raise ValueError("group_by parameter is required")
@@ -198,17 +254,94 @@ class AggregateAction(TransformDataAction):
         if not aggregations:
             raise ValueError("aggregations parameter is required")
         
-        # Group by the specified column(s)
-        grouped = df.groupby(group_by)
-        
-        # Apply aggregations
-        result = grouped.agg(aggregations)
+        if engine == "polars":
+            result = self._aggregate_polars(df, group_by, aggregations)
+        elif engine == "pandas":
+            # Group by the specified column(s); categorical keys only form
+            # groups for the categories present, as with the polars engine
+            grouped = df.groupby(group_by, observed=True)
+            
+            # Apply aggregations
+            result = grouped.agg(aggregations)
+        else:
+            raise ValueError(f"Unknown aggregation engine: {engine}")
         
         # Reset index if requested
         if reset_index:
             result = result.reset_index()
         
         return result
+    
+    def _aggregate_polars(
+        self,
+        df: pd.DataFrame,
+        group_by: Union[str, List[str]],
+        aggregations: Dict[str, Union[str, List[str]]]
+    ) -> pd.DataFrame:
+        """Aggregate with Polars' multi-threaded group-by.
+        
+        The result has the same shape as pandas' groupby().agg(): sorted group
+        keys as the index, and (column, function) columns if any column has a
+        list of functions.
+        
+        Args:
+            df: The input DataFrame
+            group_by: Column(s) to group by
+            aggregations: Dictionary mapping columns to aggregation functions
+            
+        Returns:
+            The aggregated data as a pandas DataFrame
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "polars and pyarrow are required for engine='polars'. "
+                "Install them with 'pip install polars pyarrow'."
+            )
+        
+        # Like pandas, ignore missing values, including in first and last
+        functions = {
+            "mean": lambda col: col.mean(),
+            "sum": lambda col: col.sum(),
+            "min": lambda col: col.min(),
+            "max": lambda col: col.max(),
+            "std": lambda col: col.std(),
+            "var": lambda col: col.var(),
+            "median": lambda col: col.median(),
+            "count": lambda col: col.count(),
+            "nunique": lambda col: col.drop_nulls().n_unique(),
+            "first": lambda col: col.drop_nulls().first(),
+            "last": lambda col: col.drop_nulls().last(),
+        }
+        
+        keys = [group_by] if isinstance(group_by, str) else list(group_by)
+        multi = any(isinstance(funcs, list) for funcs in aggregations.values())
+        
+        exprs = []
+        names = []
+        for column, funcs in aggregations.items():
+            for func in funcs if isinstance(funcs, list) else [funcs]:
+                if func not in functions:
+                    raise ValueError(f"Unsupported aggregation for the polars engine: {func}")
+                exprs.append(functions[func](pl.col(column)).alias(f"{column}_{func}"))
+                names.append((column, func) if multi else column)
+        
+        # pandas drops rows with missing group keys and sorts the groups
+        result = (
+            pl.from_pandas(df[keys + [c for c in aggregations if c not in keys]])
+            .lazy()
+            .drop_nulls(keys)
+            .group_by(keys)
+            .agg(exprs)
+            .sort(keys)
+            .collect()
+            .to_pandas()
+            .set_index(keys)
+        )
+        result.columns = pd.MultiIndex.from_tuples(names) if multi else names
+        
+        return result
 
 
 class PivotAction(TransformDataAction):
@@ -319,6 +452,10 @@ class EncodeAction(TransformDataAction):
                 - drop_first: Whether to drop the first category (default: False)
                 - handle_unknown: How to handle unknown categories (default: 'error')
                   Options: 'error', 'ignore'
+                - sparse: Whether to store onehot/dummy columns as pandas sparse
+                  columns (default: False)
+                - dtype: Data type of the onehot/dummy columns (default: 'float64'
+                  for onehot, 'bool' for dummy)
                 - inplace: Whether to modify the original DataFrame (default: False)
         """
         super().__init__(name, config)
@@ -342,33 +479,43 @@ class EncodeAction(TransformDataAction):
         method = self.config.get("method", "onehot")
         drop_first = self.config.get("drop_first", False)
         handle_unknown = self.config.get("handle_unknown", "error")
+        sparse = self.config.get("sparse", False)
+        dtype = self.config.get("dtype")
         inplace = self.config.get("inplace", False)
         
         if not columns:
             raise ValueError("columns parameter is required")
         
         # Make a copy of the DataFrame if not inplace
-        if not inplace:
+        if not inplace and not self.owns_input(df, context):
             df = df.copy()
         
         # Apply encoding based on the method
         if method == "onehot":
             # One-hot encoding
             encoder = OneHotEncoder(
-                sparse=False,
                 drop="first" if drop_first else None,
-                handle_unknown=handle_unknown
+                handle_unknown=handle_unknown,
+                dtype=np.dtype(dtype or "float64")
             )
             
-            # Fit and transform the data
+            # Fit and transform the data (the encoder returns a sparse matrix)
             encoded = encoder.fit_transform(df[columns])
+            feature_names = encoder.get_feature_names_out(columns)
             
             # Create a DataFrame with the encoded data
-            encoded_df = pd.DataFrame(
-                encoded,
-                columns=encoder.get_feature_names_out(columns),
-                index=df.index
-            )
+            if sparse:
+                encoded_df = pd.DataFrame.sparse.from_spmatrix(
+                    encoded,
+                    index=df.index,
+                    columns=feature_names
+                )
+            else:
+                encoded_df = pd.DataFrame(
+                    encoded.toarray(),
+                    columns=feature_names,
+                    index=df.index
+                )
             
             # Drop the original columns and add the encoded ones
             df = df.drop(columns, axis=1)
@@ -402,7 +549,9 @@ class EncodeAction(TransformDataAction):
             dummy_df = pd.get_dummies(
                 df[columns],
                 drop_first=drop_first,
-                prefix=columns
+                prefix=columns,
+                sparse=sparse,
+                dtype=np.dtype(dtype or "bool")
             )
             
             # Drop the original columns and add the dummy ones
@@ -16,6 +16,10 @@ from taskmaster.actions.transform_data import NormalizeAction
 from taskmaster.actions.save_data import SaveCSVAction, SaveJSONAction
 
 
+# Runner shared by all autopilot runs
+_runner = WorkflowRunner()
+
+
 def autopilot(config_path: Optional[str] = None, data_path: Optional[str] = None, **kwargs) -> Dict[str, Any]:
     """Run a workflow in autopilot mode.
     
@@ -42,24 +46,35 @@ def autopilot(config_path: Optional[str] = None, data_path: Optional[str] = None
         config = load_workflow_config(config_path)
         workflow = load_workflow_from_config(config)
         
-        runner = WorkflowRunner()
-        runner.register_workflow(workflow)
-        
-        return runner.run_workflow_now(workflow.id, kwargs)
+        return _run_once(workflow, kwargs)
     
     elif data_path:
         # Create a simple workflow to load, clean, and save the data
         workflow = create_data_workflow(data_path, **kwargs)
         
-        runner = WorkflowRunner()
-        runner.register_workflow(workflow)
-        
-        return runner.run_workflow_now(workflow.id)
+        return _run_once(workflow)
     
     else:
         raise ValueError("Either config_path or data_path must be provided")
 
 
+def _run_once(workflow: Workflow, event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run a workflow on the shared runner, then unregister it.
+    
+    Args:
+        workflow: The workflow to run
+        event_data: Data to pass to the workflow
+    
+    Returns:
+        The workflow context after execution
+    """
+    _runner.register_workflow(workflow)
+    try:
+        return _runner.run_workflow_now(workflow.id, event_data)
+    finally:
+        _runner.unregister_workflow(workflow.id)
+
+
 def create_data_workflow(data_path: str, **kwargs) -> Workflow:
     """Create a simple workflow to load, clean, and save data.
     
@@ -4,22 +4,66 @@ CLI commands for TaskMasterPy.
 
 This module defines the command-line interface for TaskMasterPy.
 """
+import copy
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
+import threading
 import time
-import yaml
-import json
-from typing import Dict, Any, Optional, List, Union
+from contextlib import contextmanager
+from operator import attrgetter
+from hashlib import blake2b
+from typing import Dict, Any, Generator, Iterator, NamedTuple, Optional, List, Tuple, Union, TYPE_CHECKING
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from taskmaster.core.workflow import Workflow
 from taskmaster.core.runner import WorkflowRunner
 from taskmaster.utils.config import load_workflow_from_config
 from taskmaster.utils.validators import validate_workflow_config
-from taskmaster.storage.db_storage import WorkflowStorage
+from taskmaster.utils.serialization import json_dumps, json_loads
+
+if TYPE_CHECKING:
+    from rich.table import Table
+    from taskmaster.storage.db_storage import WorkflowStorage
+
+# Rich tables/progress bars, PyYAML and the workflow database are imported or
+# opened inside the commands that need them, so that `--help` and commands
+# that don't use them start faster.
+
+# Parsed workflow files keyed by absolute path. Each entry holds the file's
+# (st_mtime_ns, st_size) when it was parsed, the parsed config and, once
+# computed, its validation result.
+_parse_cache: Dict[str, List[Any]] = {}
+
+# Directory of the caches kept between CLI invocations. They live outside the
+# config directories, where every .json file is taken for a workflow.
+CACHE_DIR = os.environ.get("TASKMASTER_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".taskmaster", "cache"
+)
+
+# Workflow files whose parsed config is also cached on disk; parsing the
+# cached JSON is much cheaper than parsing YAML, but not than parsing JSON
+_SIDECAR_SUFFIXES = (".yaml", ".yml")
+
+# Files larger than this are never parsed while searching for a workflow ID
+MAX_WORKFLOW_BYTES = 10 * 1024 * 1024
+
+# File suffixes recognized as workflow configuration files
+WORKFLOW_FILE_SUFFIXES = (".yaml", ".yml", ".json")
+
+# Directories with fewer workflow files than this are listed without threads
+_MIN_PARALLEL_FILES = 4
+
+# Top-level keys shown when listing workflows
+_HEADER_KEYS = ("id", "name", "description")
+
+# Top-level keys that must hold non-empty lists in a valid workflow
+_LIST_KEYS = ("triggers", "actions")
+
+# Plain YAML scalars that resolve to null
+_YAML_NULLS = ("", "~", "null", "Null", "NULL")
 
 app = typer.Typer(
     name="taskmaster",
@@ -36,10 +80,178 @@ db_app = typer.Typer(
 
 app.add_typer(db_app, name="db")
 
-console = Console()
+# All output uses explicit markup, so Rich's automatic highlighting is off
+console = Console(highlight=False)
+
+# Seconds an operation may take before a status spinner is shown
+_STATUS_DELAY = 0.25
+
+# Cell values repeated on every row of the workflow listings
+_YES = "[green]Yes[/green]"
+_NO = "[red]No[/red]"
+_NO_DESC = "No description"
+
+# (header, style) pairs for the workflow listing tables
+_FILE_COLUMNS = (
+    ("ID", "cyan"),
+    ("Name", "green"),
+    ("Description", "blue"),
+    ("Path", "yellow"),
+    ("Valid", "magenta"),
+)
+_DB_COLUMNS = (
+    ("ID", "cyan"),
+    ("Name", "green"),
+    ("Description", "blue"),
+    ("Created", "yellow"),
+    ("Updated", "magenta"),
+)
+
+
+def _make_table(title: str, columns: Tuple[Tuple[str, str], ...]) -> "Table":
+    """Create a Rich table with the given columns.
+
+    Args:
+        title: The table title
+        columns: (header, style) pairs for the columns
+
+    Returns:
+        The empty table
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+def _print_db_workflows(title: str, workflows: List[Dict[str, Any]]) -> None:
+    """Print workflows stored in the database as a table.
+
+    Args:
+        title: The table title
+        workflows: The workflow records from the database
+    """
+    table = _make_table(title, _DB_COLUMNS)
+    for workflow in workflows:
+        table.add_row(
+            workflow["id"],
+            workflow["name"],
+            workflow["description"] or _NO_DESC,
+            workflow["created_at"],
+            workflow["updated_at"]
+        )
+    console.print(table)
+
+
+@functools.lru_cache(maxsize=None)
+def _storage() -> "WorkflowStorage":
+    """Get the workflow storage, opening the database on first use.
+
+    Returns:
+        The shared workflow storage
+    """
+    from taskmaster.storage.db_storage import WorkflowStorage
+
+    return WorkflowStorage()
+
+
+# Runner shared by the commands that execute workflows
+_runner = WorkflowRunner()
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """Get the fastest available safe YAML loader.
+
+    Returns:
+        The libyaml-backed CSafeLoader when PyYAML was built with it,
+        otherwise the pure-Python SafeLoader
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@contextmanager
+def _maybe_status(message: str, delay: float = _STATUS_DELAY) -> Generator[None, None, None]:
+    """Show a status spinner only if the wrapped operation takes a while.
+
+    Most loads and validations finish in a few milliseconds, faster than
+    Rich can set up and tear down its live display, so the spinner is
+    started from a timer once the delay has passed.
+
+    Args:
+        message: The status message to show
+        delay: Seconds to wait before showing the spinner
+    """
+    lock = threading.Lock()
+    status = None
+    done = False
+
+    def start() -> None:
+        nonlocal status
+        with lock:
+            if not done:
+                status = console.status(message)
+                status.start()
+
+    timer = threading.Timer(delay, start)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        with lock:
+            done = True
+            if status is not None:
+                status.stop()
+
+
+def _run_with_progress(runner: WorkflowRunner, workflow: Workflow) -> Dict[str, Any]:
+    """Run a workflow while showing a spinner.
+
+    Args:
+        runner: The runner the workflow is registered with
+        workflow: The workflow to run
+
+    Returns:
+        The workflow context after execution
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]Running workflow...[/bold blue]"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Running", total=None)
+
+        # Run the workflow
+        result_context = runner.run_workflow_now(workflow.id)
+
+        progress.update(task, completed=True)
 
-# Initialize workflow storage
-workflow_storage = WorkflowStorage()
+    return result_context
+
+
+def _report_completion(workflow: Workflow, elapsed_time: float) -> None:
+    """Print the outcome of a workflow run, exiting with an error if any action failed.
+
+    Args:
+        workflow: The workflow that was run
+        elapsed_time: How long the run took, in seconds
+    """
+    console.print(f"[bold green]Workflow completed in {elapsed_time:.2f} seconds.[/bold green]")
+
+    failed_actions = workflow.failed_actions()
+    if failed_actions:
+        console.print(f"[bold red]{len(failed_actions)} action(s) failed:[/bold red]")
+        for action in failed_actions:
+            console.print(f"  - {action.name}: {action.error}")
+        sys.exit(1)
 
 
 @app.command("run")
@@ -56,8 +268,8 @@ def run_workflow(
 
         if use_db or (not os.path.exists(config_path) and len(config_path) >= 8):
             # Try to load from database
-            with console.status(f"Loading workflow {config_path} from database..."):
-                workflow = workflow_storage.get_workflow_instance(config_path)
+            with _maybe_status(f"Loading workflow {config_path} from database..."):
+                workflow = _storage().get_workflow_instance(config_path)
 
             if not workflow:
                 console.print(f"[bold red]Error:[/bold red] Workflow with ID '{config_path}' not found in database")
@@ -72,11 +284,11 @@ def run_workflow(
                 sys.exit(1)
 
             # Load the configuration
-            with console.status(f"Loading configuration from {config_path}..."):
+            with _maybe_status(f"Loading configuration from {config_path}..."):
                 config = load_workflow_config(config_path)
 
             # Validate the configuration
-            with console.status("Validating configuration..."):
+            with _maybe_status("Validating configuration..."):
                 is_valid, errors = validate_workflow_config(config)
 
             if not is_valid:
@@ -91,12 +303,11 @@ def run_workflow(
                 return
 
             # Create the workflow
-            with console.status("Creating workflow..."):
+            with _maybe_status("Creating workflow..."):
                 workflow = load_workflow_from_config(config)
 
-        # Create a runner
-        runner = WorkflowRunner()
-        runner.register_workflow(workflow)
+        # Register the workflow with the shared runner
+        _runner.register_workflow(workflow)
 
         # Run the workflow
         console.print(f"[bold blue]Running workflow: {workflow.name}[/bold blue]")
@@ -104,37 +315,12 @@ def run_workflow(
         start_time = time.time()
 
         if wait:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Running workflow...[/bold blue]"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Running", total=None)
-
-                # Run the workflow
-                result_context = runner.run_workflow_now(workflow.id)
-
-                progress.update(task, completed=True)
-
-            # Print the results
-            elapsed_time = time.time() - start_time
-            console.print(f"[bold green]Workflow completed in {elapsed_time:.2f} seconds.[/bold green]")
-
-            # Check if any actions failed
-            failed_actions = [
-                action for action in workflow.actions.values()
-                if action.status == "failed"
-            ]
-
-            if failed_actions:
-                console.print(f"[bold red]{len(failed_actions)} action(s) failed:[/bold red]")
-                for action in failed_actions:
-                    console.print(f"  - {action.name}: {action.error}")
-                sys.exit(1)
+            result_context = _run_with_progress(_runner, workflow)
+            _report_completion(workflow, time.time() - start_time)
 
         else:
             # Start the workflow and return immediately
-            runner.start_workflow(workflow.id)
+            _runner.start_workflow(workflow.id)
             console.print("[bold yellow]Workflow started in the background.[/bold yellow]")
 
     except Exception as e:
@@ -145,70 +331,34 @@ def run_workflow(
 @app.command("list-workflows")
 def list_workflows(
     config_dir: str = typer.Argument(".", help="Directory containing workflow configuration files"),
-    include_db: bool = typer.Option(True, "--include-db/--no-db", help="Include workflows from the database")
+    include_db: bool = typer.Option(True, "--include-db/--no-db", help="Include workflows from the database"),
+    deep_validate: bool = typer.Option(False, "--deep-validate", help="Fully parse and validate each workflow file, instead of only checking that it has a name, triggers and actions")
 ):
     """List available workflows from files and/or database."""
     try:
         file_workflows = []
         db_workflows = []
 
-        # Get workflows from files
-        if os.path.exists(config_dir):
-            # Find all YAML and JSON files in the directory
-            workflow_files = []
-            for root, _, files in os.walk(config_dir):
-                for file in files:
-                    if file.endswith((".yaml", ".yml", ".json")):
-                        workflow_files.append(os.path.join(root, file))
-
-            # Load and validate each workflow file
-            for file_path in workflow_files:
-                try:
-                    config = load_workflow_config(file_path)
-                    is_valid, _ = validate_workflow_config(config)
-
-                    workflow_id = config.get("id", "")
-                    name = config.get("name", "")
-                    description = config.get("description", "")
-
-                    file_workflows.append({
-                        "id": workflow_id or "N/A",
-                        "name": name or os.path.basename(file_path),
-                        "description": description or "No description",
-                        "path": file_path,
-                        "valid": is_valid
-                    })
-
-                except Exception as e:
-                    file_workflows.append({
-                        "id": "N/A",
-                        "name": os.path.basename(file_path),
-                        "description": f"Error: {str(e)}",
-                        "path": file_path,
-                        "valid": False
-                    })
-
-        # Get workflows from database
-        if include_db:
-            db_workflows = workflow_storage.list_workflows()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Query the database in the background while the files are read
+            db_future = executor.submit(lambda: _storage().list_workflows()) if include_db else None
+
+            # Get workflows from files
+            if os.path.exists(config_dir):
+                # Read each YAML and JSON file in the directory. Without
+                # --deep-validate only the top-level keys are read and checked.
+                file_workflows = _read_workflow_rows(list(iter_workflow_files(config_dir)), deep_validate)
+                file_workflows.sort(key=attrgetter("path"))
+
+            # Get workflows from database
+            if db_future is not None:
+                db_workflows = db_future.result()
 
         # Display file workflows
         if file_workflows:
-            table = Table(title="File-Based Workflows")
-            table.add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Description", style="blue")
-            table.add_column("Path", style="yellow")
-            table.add_column("Valid", style="magenta")
-
-            for workflow in file_workflows:
-                table.add_row(
-                    workflow["id"],
-                    workflow["name"],
-                    workflow["description"],
-                    workflow["path"],
-                    "[green]Yes[/green]" if workflow["valid"] else "[red]No[/red]"
-                )
+            table = _make_table("File-Based Workflows", _FILE_COLUMNS)
+            for row in file_workflows:
+                table.add_row(row.id, row.name, row.description, row.path, _YES if row.valid else _NO)
 
             console.print(table)
         elif os.path.exists(config_dir):
@@ -219,23 +369,7 @@ def list_workflows(
         # Display database workflows
         if include_db:
             if db_workflows:
-                table = Table(title="Database Workflows")
-                table.add_column("ID", style="cyan")
-                table.add_column("Name", style="green")
-                table.add_column("Description", style="blue")
-                table.add_column("Created", style="yellow")
-                table.add_column("Updated", style="magenta")
-
-                for workflow in db_workflows:
-                    table.add_row(
-                        workflow["id"],
-                        workflow["name"],
-                        workflow["description"] or "No description",
-                        workflow["created_at"],
-                        workflow["updated_at"]
-                    )
-
-                console.print(table)
+                _print_db_workflows("Database Workflows", db_workflows)
             else:
                 console.print("[bold yellow]No workflows found in the database.[/bold yellow]")
 
@@ -260,11 +394,11 @@ def validate_workflow(
             sys.exit(1)
 
         # Load the configuration
-        with console.status(f"Loading configuration from {config_path}..."):
+        with _maybe_status(f"Loading configuration from {config_path}..."):
             config = load_workflow_config(config_path)
 
         # Validate the configuration
-        with console.status("Validating configuration..."):
+        with _maybe_status("Validating configuration..."):
             is_valid, errors = validate_workflow_config(config)
 
         if is_valid:
@@ -293,42 +427,27 @@ def trigger_workflow(
 
         # Try to load from database first if specified
         if use_db:
-            with console.status(f"Loading workflow {workflow_id} from database..."):
-                workflow = workflow_storage.get_workflow_instance(workflow_id)
+            with _maybe_status(f"Loading workflow {workflow_id} from database..."):
+                workflow = _storage().get_workflow_instance(workflow_id)
 
             if workflow:
                 console.print(f"[bold green]Loaded workflow from database: {workflow.name}[/bold green]")
 
         # If not found in database or not using database, try files
         if not workflow:
-            workflow_config = None
             workflow_path = None
 
             # Check if the workflow_id is a file path
             if os.path.exists(workflow_id):
                 workflow_path = workflow_id
-            else:
-                # Search for the workflow in the config directory
-                for root, _, files in os.walk(config_dir):
-                    for file in files:
-                        if file.endswith((".yaml", ".yml", ".json")):
-                            file_path = os.path.join(root, file)
-                            try:
-                                config = load_workflow_config(file_path)
-                                if config.get("id") == workflow_id:
-                                    workflow_config = config
-                                    workflow_path = file_path
-                                    break
-                            except:
-                                pass
-
-                    if workflow_config:
-                        break
+            elif os.path.isdir(config_dir):
+                # Look the workflow up in the config directory's ID index
+                workflow_path = find_workflow_file(config_dir, workflow_id)
 
             if not workflow_path and not use_db:
                 # If not using DB and not found in files, try DB as a fallback
-                with console.status(f"Looking for workflow {workflow_id} in database..."):
-                    workflow = workflow_storage.get_workflow_instance(workflow_id)
+                with _maybe_status(f"Looking for workflow {workflow_id} in database..."):
+                    workflow = _storage().get_workflow_instance(workflow_id)
 
                 if not workflow:
                     console.print(f"[bold red]Error:[/bold red] Workflow with ID '{workflow_id}' not found")
@@ -336,12 +455,12 @@ def trigger_workflow(
 
                 console.print(f"[bold green]Loaded workflow from database: {workflow.name}[/bold green]")
             elif workflow_path:
-                # Load the workflow configuration if needed
-                if not workflow_config:
-                    workflow_config = load_workflow_config(workflow_path)
+                # Only the matched file is parsed; the parse cache keeps it for
+                # any later load in this process
+                workflow_config = load_workflow_config(workflow_path)
 
                 # Create the workflow
-                with console.status("Creating workflow..."):
+                with _maybe_status("Creating workflow..."):
                     workflow = load_workflow_from_config(workflow_config)
 
                 console.print(f"[bold green]Loaded workflow from file: {workflow.name}[/bold green]")
@@ -349,9 +468,8 @@ def trigger_workflow(
                 console.print(f"[bold red]Error:[/bold red] Workflow with ID '{workflow_id}' not found")
                 sys.exit(1)
 
-        # Create a runner
-        runner = WorkflowRunner()
-        runner.register_workflow(workflow)
+        # Register the workflow with the shared runner
+        _runner.register_workflow(workflow)
 
         # Run the workflow
         console.print(f"[bold blue]Triggering workflow: {workflow.name}[/bold blue]")
@@ -359,37 +477,12 @@ def trigger_workflow(
         start_time = time.time()
 
         if wait:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Running workflow...[/bold blue]"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Running", total=None)
-
-                # Run the workflow
-                result_context = runner.run_workflow_now(workflow.id)
-
-                progress.update(task, completed=True)
-
-            # Print the results
-            elapsed_time = time.time() - start_time
-            console.print(f"[bold green]Workflow completed in {elapsed_time:.2f} seconds.[/bold green]")
-
-            # Check if any actions failed
-            failed_actions = [
-                action for action in workflow.actions.values()
-                if action.status == "failed"
-            ]
-
-            if failed_actions:
-                console.print(f"[bold red]{len(failed_actions)} action(s) failed:[/bold red]")
-                for action in failed_actions:
-                    console.print(f"  - {action.name}: {action.error}")
-                sys.exit(1)
+            result_context = _run_with_progress(_runner, workflow)
+            _report_completion(workflow, time.time() - start_time)
 
         else:
             # Start the workflow and return immediately
-            runner.start_workflow(workflow.id)
+            _runner.start_workflow(workflow.id)
             console.print("[bold yellow]Workflow started in the background.[/bold yellow]")
 
     except Exception as e:
@@ -400,19 +493,519 @@ def trigger_workflow(
 def load_workflow_config(config_path: str) -> Dict[str, Any]:
     """Load a workflow configuration from a file.
 
+    Parsed files are cached for the lifetime of the process, and YAML files
+    also on disk between invocations. They are reparsed only when their
+    modification time or size changes.
+
     Args:
         config_path: Path to the configuration file
 
     Returns:
         The workflow configuration as a dictionary
     """
-    with open(config_path, "r") as f:
-        if config_path.endswith((".yaml", ".yml")):
-            return yaml.safe_load(f)
-        elif config_path.endswith(".json"):
-            return json.load(f)
+    entry = _get_cache_entry(config_path)
+    # Hand out a copy so callers can't modify the cached config
+    return copy.deepcopy(entry[1])
+
+
+def load_and_validate_workflow_config(config_path: str) -> Tuple[Dict[str, Any], bool, List[str]]:
+    """Load a workflow configuration from a file and validate it.
+
+    The validation result is cached alongside the parsed configuration.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        A tuple containing the configuration, whether it is valid and a list
+        of error messages
+    """
+    entry = _get_cache_entry(config_path)
+    if entry[2] is None:
+        is_valid, errors = validate_workflow_config(entry[1])
+        entry[2] = [is_valid, list(errors)]
+        _write_sidecar(os.path.abspath(config_path), entry)
+    is_valid, errors = entry[2]
+    return copy.deepcopy(entry[1]), is_valid, list(errors)
+
+
+def _get_cache_entry(config_path: str) -> List[Any]:
+    """Get the parse cache entry for a file, parsing it if it changed.
+
+    Entries of YAML files are also kept in a JSON sidecar under CACHE_DIR,
+    so later CLI invocations skip parsing unchanged files.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        The cache entry as [(mtime_ns, size), config, validation result]
+    """
+    stat = os.stat(config_path)
+    key = os.path.abspath(config_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _parse_cache.get(key)
+    if entry is None or entry[0] != version:
+        entry = _read_sidecar(key, version)
+        if entry is None:
+            entry = [version, _parse_config_file(config_path), None]
+            _write_sidecar(key, entry)
+        _parse_cache[key] = entry
+    return entry
+
+
+def _cache_file(kind: str, path: str) -> str:
+    """Get the path of a file in the on-disk cache.
+
+    Args:
+        kind: The kind of cache, used as a subdirectory of CACHE_DIR
+        path: The absolute path the cached data belongs to
+
+    Returns:
+        The path of the cache file
+    """
+    digest = blake2b(path.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, kind, f"{digest}.json")
+
+
+def _read_cache_file(cache_path: str) -> Any:
+    """Read a file of the on-disk cache.
+
+    Args:
+        cache_path: Path of the cache file
+
+    Returns:
+        The cached data, or None if the file is missing or unreadable
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_file(cache_path: str, data: Any) -> None:
+    """Write a file of the on-disk cache.
+
+    The file is replaced atomically, so concurrent invocations never read a
+    partial file. Errors are ignored, since the cache is only an optimization.
+
+    Args:
+        cache_path: Path of the cache file
+        data: The data to cache
+    """
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(json_dumps(data))
+        os.replace(temp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _read_sidecar(key: str, version: Tuple[int, int]) -> Optional[List[Any]]:
+    """Read the cached parse of a workflow file from its on-disk sidecar.
+
+    Args:
+        key: Absolute path of the configuration file
+        version: The file's current (st_mtime_ns, st_size)
+
+    Returns:
+        The parse cache entry, or None if there is no sidecar for this version
+    """
+    if not key.endswith(_SIDECAR_SUFFIXES):
+        return None
+
+    data = _read_cache_file(_cache_file("parsed", key))
+    if not isinstance(data, dict) or data.get("path") != key or data.get("version") != list(version):
+        return None
+    return [version, data.get("config"), data.get("validation")]
+
+
+def _write_sidecar(key: str, entry: List[Any]) -> None:
+    """Store a parse cache entry in the on-disk sidecar of its workflow file.
+
+    Configs that JSON can't represent exactly, e.g. with dates or non-string
+    keys, are not stored.
+
+    Args:
+        key: Absolute path of the configuration file
+        entry: The parse cache entry
+    """
+    if not key.endswith(_SIDECAR_SUFFIXES):
+        return
+
+    version, config, validation = entry
+    try:
+        if json_loads(json_dumps(config)) != config:
+            return
+    except (TypeError, ValueError):
+        return
+
+    _write_cache_file(_cache_file("parsed", key), {
+        "path": key,
+        "version": list(version),
+        "config": config,
+        "validation": validation
+    })
+
+
+def iter_workflow_files(config_dir: str) -> Iterator[str]:
+    """Iterate over the workflow configuration files under a directory.
+
+    Uses os.scandir, whose directory entries already know their type, so
+    no extra stat call is needed per file. Symlinked directories are not
+    followed.
+
+    Args:
+        config_dir: Directory containing workflow configuration files
+
+    Yields:
+        Paths of the YAML and JSON files found
+    """
+    stack = [config_dir]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(WORKFLOW_FILE_SUFFIXES):
+                    yield entry.path
+
+
+def read_workflow_header(config_path: str) -> Dict[str, Any]:
+    """Read the top-level id, name and description of a workflow file.
+
+    YAML files are read as a stream of parser events, stopping as soon as
+    the three keys have been seen, so the actions and triggers are never
+    turned into Python objects. JSON files are loaded in full.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        A dictionary with whichever of the header keys the file defines
+    """
+    header, _ = _scan_workflow_file(config_path, check_structure=False)
+    return header
+
+
+def read_workflow_summary(config_path: str) -> Tuple[Dict[str, Any], bool]:
+    """Read the header of a workflow file and check its structure.
+
+    The check is the cheap part of validate_workflow_config: the workflow
+    must have a name and non-empty lists of triggers and actions. The
+    triggers and actions themselves aren't checked. YAML files are read
+    as a stream of parser events, as in read_workflow_header, but to the
+    end of the top-level mapping.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        A tuple of (header, has_required_structure)
+    """
+    return _scan_workflow_file(config_path, check_structure=True)
+
+
+def _scan_workflow_file(config_path: str, check_structure: bool) -> Tuple[Dict[str, Any], bool]:
+    """Read the header of a workflow file, and optionally check its structure.
+
+    Args:
+        config_path: Path to the configuration file
+        check_structure: Whether to check for the required top-level keys
+
+    Returns:
+        A tuple of (header, has_required_structure); the second item is
+        False when check_structure is False
+    """
+    if not config_path.endswith((".yaml", ".yml")):
+        config = load_workflow_config(config_path)
+        header = {key: config[key] for key in _HEADER_KEYS if key in config}
+        has_structure = check_structure and "name" in config and all(
+            isinstance(config.get(key), list) and len(config[key]) > 0 for key in _LIST_KEYS
+        )
+        return header, has_structure
+
+    import yaml
+
+    header = {}
+    # Keys of _LIST_KEYS whose value is a non-empty sequence
+    non_empty = set()
+    seen_name = False
+    depth = 0
+    key = None
+    # The key of _LIST_KEYS whose sequence is being read
+    list_key = None
+    with open(config_path, "rb") as f:
+        for event in yaml.parse(f, Loader=_yaml_loader()):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if depth == 0 and isinstance(event, yaml.SequenceStartEvent):
+                    # Not a mapping, so there is no header to read
+                    break
+                if depth == 1:
+                    if key in _LIST_KEYS and isinstance(event, yaml.SequenceStartEvent):
+                        list_key = key
+                    # A nested value; the next top-level scalar is a key again
+                    key = None
+                elif depth == 2 and list_key is not None:
+                    non_empty.add(list_key)
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+                if depth == 1:
+                    list_key = None
+                elif depth == 0:
+                    break
+            elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if key is None:
+                    key = getattr(event, "value", "")
+                    seen_name = seen_name or key == "name"
+                    continue
+                if key in _HEADER_KEYS and isinstance(event, yaml.ScalarEvent):
+                    is_null = event.implicit[0] and event.value in _YAML_NULLS
+                    header[key] = None if is_null else event.value
+                    if not check_structure and len(header) == len(_HEADER_KEYS):
+                        break
+                key = None
+            elif depth == 2 and list_key is not None:
+                non_empty.add(list_key)
+
+    has_structure = check_structure and seen_name and len(non_empty) == len(_LIST_KEYS)
+    return header, has_structure
+
+
+class WorkflowRow(NamedTuple):
+    """A row of the file-based workflow listing."""
+
+    id: str
+    name: str
+    description: str
+    path: str
+    valid: bool
+
+
+def _read_workflow_rows(file_paths: List[str], deep_validate: bool) -> List[WorkflowRow]:
+    """Read the listing rows for several workflow files.
+
+    Files are read on a thread pool since the work is dominated by file I/O
+    and the C YAML parser; small directories are read inline to avoid the
+    pool's startup cost.
+
+    Args:
+        file_paths: Paths to the configuration files
+        deep_validate: Whether to fully parse and validate the files
+
+    Returns:
+        The rows, in the same order as file_paths
+    """
+    if len(file_paths) < _MIN_PARALLEL_FILES:
+        return [_read_workflow_row(file_path, deep_validate) for file_path in file_paths]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda file_path: _read_workflow_row(file_path, deep_validate), file_paths))
+
+
+def _read_workflow_row(file_path: str, deep_validate: bool) -> WorkflowRow:
+    """Read the listing row for a workflow file.
+
+    Args:
+        file_path: Path to the configuration file
+        deep_validate: Whether to fully parse and validate the file, instead
+            of only checking for the required top-level keys
+
+    Returns:
+        The row describing the workflow, or the error that occurred
+    """
+    try:
+        if deep_validate:
+            config, is_valid, _ = load_and_validate_workflow_config(file_path)
         else:
-            raise ValueError(f"Unsupported file format: {config_path}")
+            config, is_valid = read_workflow_summary(file_path)
+
+        return WorkflowRow(
+            id=str(config.get("id") or "N/A"),
+            name=str(config.get("name") or os.path.basename(file_path)),
+            description=str(config.get("description") or _NO_DESC),
+            path=file_path,
+            valid=is_valid
+        )
+
+    except Exception as e:
+        return WorkflowRow(
+            id="N/A",
+            name=os.path.basename(file_path),
+            description=f"Error: {str(e)}",
+            path=file_path,
+            valid=False
+        )
+
+
+def build_workflow_index(config_dir: str) -> Dict[str, str]:
+    """Map the workflow IDs of the files in a directory to their paths.
+
+    The index is persisted under CACHE_DIR, with each file's modification
+    time and size, so only new or modified files need to be read again in
+    later invocations. The ID of a YAML file is read with
+    read_workflow_header, without building the actions and triggers.
+
+    Args:
+        config_dir: Directory containing workflow configuration files
+
+    Returns:
+        A dictionary mapping workflow IDs to file paths
+    """
+    import yaml
+
+    old_entries = _read_index_entries(config_dir)
+
+    entries = {}
+    for file_path in iter_workflow_files(config_dir):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+
+        # Keys are relative so the index is the same from any working directory
+        key = os.path.relpath(file_path, config_dir)
+        cached = old_entries.get(key)
+        if cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            entries[key] = cached
+            continue
+
+        # Oversized or unreadable files are indexed without an ID, so they
+        # are skipped until they are modified
+        workflow_id = None
+        if stat.st_size <= MAX_WORKFLOW_BYTES:
+            try:
+                workflow_id = _read_workflow_id(file_path)
+            except (yaml.YAMLError, OSError, ValueError):
+                pass
+        entries[key] = [stat.st_mtime_ns, stat.st_size, workflow_id]
+
+    if entries != old_entries:
+        config_dir_key = os.path.abspath(config_dir)
+        _write_cache_file(
+            _cache_file("index", config_dir_key),
+            {"config_dir": config_dir_key, "files": entries}
+        )
+
+    index = {}
+    for key, (_, _, workflow_id) in entries.items():
+        if workflow_id and workflow_id not in index:
+            index[workflow_id] = os.path.join(config_dir, key)
+    return index
+
+
+def find_workflow_file(config_dir: str, workflow_id: str) -> Optional[str]:
+    """Find the file of a workflow ID in a directory.
+
+    If the persisted index maps the ID to a file that hasn't changed, that
+    file is returned without scanning the directory. Otherwise the index is
+    rebuilt.
+
+    Args:
+        config_dir: Directory containing workflow configuration files
+        workflow_id: The workflow ID to look up
+
+    Returns:
+        The path of the workflow file, or None if no file has the ID
+    """
+    for key, entry in _read_index_entries(config_dir).items():
+        if entry[2] != workflow_id:
+            continue
+        file_path = os.path.join(config_dir, key)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            break
+        if entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return file_path
+        break
+
+    return build_workflow_index(config_dir).get(workflow_id)
+
+
+def _read_index_entries(config_dir: str) -> Dict[str, List[Any]]:
+    """Read the persisted workflow ID index of a directory.
+
+    Args:
+        config_dir: Directory containing workflow configuration files
+
+    Returns:
+        The entries as [mtime_ns, size, workflow ID] by path relative to the
+        directory, in scan order; empty if there is no valid index
+    """
+    config_dir_key = os.path.abspath(config_dir)
+    data = _read_cache_file(_cache_file("index", config_dir_key))
+    if not isinstance(data, dict) or data.get("config_dir") != config_dir_key:
+        return {}
+
+    entries = data.get("files")
+    if not isinstance(entries, dict) or not all(
+        isinstance(entry, list) and len(entry) == 3 for entry in entries.values()
+    ):
+        return {}
+    return entries
+
+
+def _read_workflow_id(config_path: str) -> Optional[str]:
+    """Read the workflow ID of a configuration file.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        The workflow ID, or None if the file has no ID
+    """
+    header = read_workflow_header(config_path)
+    workflow_id = header.get("id") if isinstance(header, dict) else None
+    return str(workflow_id) if workflow_id is not None else None
+
+
+def _load_yaml(f) -> Any:
+    """Parse a YAML document from a binary file."""
+    import yaml
+
+    return yaml.load(f, Loader=_yaml_loader())
+
+
+def _load_json(f) -> Any:
+    """Parse a JSON document from a binary file."""
+    return json_loads(f.read())
+
+
+# Parser for each supported configuration file extension
+_LOADERS = {
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+    ".json": _load_json,
+}
+
+
+def _parse_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML or JSON workflow configuration file.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        The workflow configuration as a dictionary
+    """
+    loader = _LOADERS.get(os.path.splitext(config_path)[1].lower())
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {config_path}")
+
+    # Both parsers accept bytes, which skips a separate UTF-8 decode pass
+    with open(config_path, "rb") as f:
+        return loader(f)
 
 
 # Database commands
@@ -426,7 +1019,7 @@ def save_workflow_to_db(
     try:
         if config:
             # Save the provided configuration
-            workflow_storage.save_workflow(workflow_id, config)
+            _storage().save_workflow(workflow_id, config)
             console.print(f"[bold green]Workflow saved to database with ID: {workflow_id}[/bold green]")
         else:
             console.print("[bold red]Error:[/bold red] No configuration provided")
@@ -441,30 +1034,14 @@ def save_workflow_to_db(
 def list_db_workflows():
     """List all workflows in the database."""
     try:
-        workflows = workflow_storage.list_workflows()
+        workflows = _storage().list_workflows()
 
         if not workflows:
             console.print("[bold yellow]No workflows found in the database.[/bold yellow]")
             return
 
-        # Create a table to display the workflows
-        table = Table(title="Workflows in Database")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Description", style="blue")
-        table.add_column("Created", style="yellow")
-        table.add_column("Updated", style="magenta")
-
-        for workflow in workflows:
-            table.add_row(
-                workflow["id"],
-                workflow["name"],
-                workflow["description"] or "No description",
-                workflow["created_at"],
-                workflow["updated_at"]
-            )
-
-        console.print(table)
+        # Display the workflows in a table
+        _print_db_workflows("Workflows in Database", workflows)
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -483,8 +1060,8 @@ def import_workflow(
             sys.exit(1)
 
         # Import the workflow
-        with console.status(f"Importing workflow from {file_path}..."):
-            workflow_id = workflow_storage.import_from_file(file_path)
+        with _maybe_status(f"Importing workflow from {file_path}..."):
+            workflow_id = _storage().import_from_file(file_path)
 
         console.print(f"[bold green]Workflow imported successfully with ID: {workflow_id}[/bold green]")
 
@@ -501,8 +1078,8 @@ def export_workflow(
     """Export a workflow from the database to a file."""
     try:
         # Export the workflow
-        with console.status(f"Exporting workflow {workflow_id} to {file_path}..."):
-            success = workflow_storage.export_to_file(workflow_id, file_path)
+        with _maybe_status(f"Exporting workflow {workflow_id} to {file_path}..."):
+            success = _storage().export_to_file(workflow_id, file_path)
 
         if success:
             console.print(f"[bold green]Workflow exported successfully to: {file_path}[/bold green]")
@@ -530,8 +1107,8 @@ def delete_workflow(
                 return
 
         # Delete the workflow
-        with console.status(f"Deleting workflow {workflow_id}..."):
-            success = workflow_storage.delete_workflow(workflow_id)
+        with _maybe_status(f"Deleting workflow {workflow_id}..."):
+            success = _storage().delete_workflow(workflow_id)
 
         if success:
             console.print(f"[bold green]Workflow deleted successfully.[/bold green]")
@@ -552,16 +1129,15 @@ def run_db_workflow(
     """Run a workflow from the database."""
     try:
         # Load the workflow
-        with console.status(f"Loading workflow {workflow_id}..."):
-            workflow = workflow_storage.get_workflow_instance(workflow_id)
+        with _maybe_status(f"Loading workflow {workflow_id}..."):
+            workflow = _storage().get_workflow_instance(workflow_id)
 
         if not workflow:
             console.print(f"[bold red]Error:[/bold red] Workflow with ID '{workflow_id}' not found")
             sys.exit(1)
 
-        # Create a runner
-        runner = WorkflowRunner()
-        runner.register_workflow(workflow)
+        # Register the workflow with the shared runner
+        _runner.register_workflow(workflow)
 
         # Run the workflow
         console.print(f"[bold blue]Running workflow: {workflow.name}[/bold blue]")
@@ -569,37 +1145,12 @@ def run_db_workflow(
         start_time = time.time()
 
         if wait:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Running workflow...[/bold blue]"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Running", total=None)
-
-                # Run the workflow
-                result_context = runner.run_workflow_now(workflow.id)
-
-                progress.update(task, completed=True)
-
-            # Print the results
-            elapsed_time = time.time() - start_time
-            console.print(f"[bold green]Workflow completed in {elapsed_time:.2f} seconds.[/bold green]")
-
-            # Check if any actions failed
-            failed_actions = [
-                action for action in workflow.actions.values()
-                if action.status == "failed"
-            ]
-
-            if failed_actions:
-                console.print(f"[bold red]{len(failed_actions)} action(s) failed:[/bold red]")
-                for action in failed_actions:
-                    console.print(f"  - {action.name}: {action.error}")
-                sys.exit(1)
+            result_context = _run_with_progress(_runner, workflow)
+            _report_completion(workflow, time.time() - start_time)
 
         else:
             # Start the workflow and return immediately
-            runner.start_workflow(workflow.id)
+            _runner.start_workflow(workflow.id)
             console.print("[bold yellow]Workflow started in the background.[/bold yellow]")
 
     except Exception as e:
@@ -5,7 +5,7 @@ This module defines the WorkflowRunner class, which is responsible for
 executing workflows either immediately or on a schedule.
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 
 from taskmaster.core.workflow import Workflow
 
@@ -20,15 +20,29 @@ class WorkflowRunner:
     def __init__(self):
         """Initialize a new workflow runner."""
         self.workflows: Dict[str, Workflow] = {}
-        self.active_workflows: Dict[str, Workflow] = {}
+        self._active: Set[str] = set()
         self.logger = logging.getLogger("taskmaster.runner")
     
+    @property
+    def active_workflows(self) -> Dict[str, Workflow]:
+        """The active workflows, keyed by ID."""
+        return {workflow_id: self.workflows[workflow_id] for workflow_id in self._active}
+    
     def register_workflow(self, workflow: Workflow) -> None:
         """Register a workflow with this runner.
         
         Args:
             workflow: The workflow to register
+            
+        Raises:
+            ValueError: If the workflow's dependencies contain a cycle
         """
+        if self.workflows.get(workflow.id) is workflow:
+            return
+        
+        # Build the execution plan now rather than on the first trigger
+        workflow.freeze()
+        
         self.workflows[workflow.id] = workflow
         self.logger.info(f"Registered workflow: {workflow}")
     
@@ -38,11 +52,11 @@ class WorkflowRunner:
         Args:
             workflow_id: The ID of the workflow to unregister
         """
-        if workflow_id in self.active_workflows:
+        if workflow_id in self._active:
             self.stop_workflow(workflow_id)
         
-        if workflow_id in self.workflows:
-            workflow = self.workflows.pop(workflow_id)
+        workflow = self.workflows.pop(workflow_id, None)
+        if workflow is not None:
             self.logger.info(f"Unregistered workflow: {workflow}")
     
     def start_workflow(self, workflow_id: str) -> None:
@@ -54,12 +68,24 @@ class WorkflowRunner:
         Args:
             workflow_id: The ID of the workflow to start
         """
-        if workflow_id not in self.workflows:
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None:
             raise ValueError(f"Workflow with ID {workflow_id} not found")
         
-        workflow = self.workflows[workflow_id]
+        if workflow_id in self._active:
+            return
+        
+        self._activate(workflow_id, workflow)
+    
+    def _activate(self, workflow_id: str, workflow: Workflow) -> None:
+        """Activate a registered workflow and mark it as active.
+        
+        Args:
+            workflow_id: The ID of the workflow
+            workflow: The workflow to activate
+        """
         workflow.activate()
-        self.active_workflows[workflow_id] = workflow
+        self._active.add(workflow_id)
         self.logger.info(f"Started workflow: {workflow}")
     
     def stop_workflow(self, workflow_id: str) -> None:
@@ -71,11 +97,12 @@ class WorkflowRunner:
         Args:
             workflow_id: The ID of the workflow to stop
         """
-        if workflow_id not in self.active_workflows:
+        if workflow_id not in self._active:
             self.logger.warning(f"Workflow with ID {workflow_id} is not active")
             return
         
-        workflow = self.active_workflows.pop(workflow_id)
+        self._active.discard(workflow_id)
+        workflow = self.workflows[workflow_id]
         workflow.deactivate()
         self.logger.info(f"Stopped workflow: {workflow}")
     
@@ -91,22 +118,22 @@ class WorkflowRunner:
         Returns:
             The workflow context after execution
         """
-        if workflow_id not in self.workflows:
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None:
             raise ValueError(f"Workflow with ID {workflow_id} not found")
         
-        workflow = self.workflows[workflow_id]
         self.logger.info(f"Running workflow now: {workflow}")
         return workflow.run(event_data)
     
     def start_all_workflows(self) -> None:
         """Start all registered workflows."""
-        for workflow_id in self.workflows:
-            if workflow_id not in self.active_workflows:
-                self.start_workflow(workflow_id)
+        for workflow_id, workflow in self.workflows.items():
+            if workflow_id not in self._active:
+                self._activate(workflow_id, workflow)
     
     def stop_all_workflows(self) -> None:
         """Stop all active workflows."""
-        for workflow_id in list(self.active_workflows.keys()):
+        for workflow_id in list(self._active):
             self.stop_workflow(workflow_id)
     
     def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
@@ -118,11 +145,11 @@ class WorkflowRunner:
         Returns:
             A dictionary containing the workflow status
         """
-        if workflow_id not in self.workflows:
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None:
             raise ValueError(f"Workflow with ID {workflow_id} not found")
         
-        workflow = self.workflows[workflow_id]
-        is_active = workflow_id in self.active_workflows
+        is_active = workflow_id in self._active
         
         action_statuses = {
             action_id: {
@@ -5,7 +5,8 @@ This module defines the Workflow class, which represents a complete workflow
 consisting of triggers and actions arranged in a directed acyclic graph (DAG).
 """
 import uuid
-from typing import Dict, Any, List, Optional, Set, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, Set, Callable, Tuple
 import logging
 
 from taskmaster.triggers.base import BaseTrigger
@@ -20,19 +21,40 @@ class Workflow:
     are executed in dependency order.
     """
 
-    def __init__(self, name: str = None, description: str = None):
+    def __init__(self, name: str = None, description: str = None, max_workers: Optional[int] = 1,
+                 reuse_intermediates: bool = False):
         """Initialize a new workflow.
 
         Args:
             name: A unique name for this workflow
             description: A description of what this workflow does
+            max_workers: Maximum number of actions run concurrently (default: 1,
+                which runs them one at a time in dependency order; None uses the
+                ThreadPoolExecutor default). Actions run concurrently must not
+                modify the context or share unsynchronized state.
+            reuse_intermediates: Whether an action with a single dependency,
+                and that is the only reader of it, may transform the
+                dependency's DataFrame in place instead of copying it. The
+                dependency's entry in the context then holds the transformed
+                data after the run.
         """
         self.id = str(uuid.uuid4())
         self.name = name or f"Workflow_{self.id[:8]}"
         self.description = description or ""
+        self.max_workers = max_workers
+        self.reuse_intermediates = reuse_intermediates
         self.triggers: List[BaseTrigger] = []
         self.actions: Dict[str, BaseAction] = {}
         self.context: Dict[str, Any] = {}
+        self._failed: List[BaseAction] = []
+        # Frozen execution plan of the action DAG, with the graph shape it was built for
+        self._levels: Optional[List[List[BaseAction]]] = None
+        self._levels_key: Optional[Tuple[Any, ...]] = None
+        # Actions that depend on each action, and how many dependencies each has
+        self._dependents: Dict[str, List[BaseAction]] = {}
+        self._dependency_counts: Dict[str, int] = {}
+        # Position of each action in the frozen plan, for ordering results
+        self._plan_positions: Dict[str, int] = {}
         self.is_running = False
         self.logger = logging.getLogger(f"taskmaster.workflow.{self.name}")
 
@@ -68,6 +90,30 @@ class Workflow:
         action.add_dependency(depends_on)
         self.logger.info(f"Added dependency: {action} depends on {depends_on}")
 
+    def add_dependencies(self, action: BaseAction, depends_on: List[BaseAction]) -> None:
+        """Add several dependencies to an action at once.
+
+        Dependencies the action already has are skipped.
+
+        Args:
+            action: The action that depends on the others
+            depends_on: The actions that must complete before the dependent action
+        """
+        if action.id not in self.actions or any(dep.id not in self.actions for dep in depends_on):
+            raise ValueError("All actions must be added to the workflow first")
+
+        existing = {dep.id for dep in action.dependencies}
+        new_dependencies = []
+        for dep in depends_on:
+            if dep.id not in existing:
+                existing.add(dep.id)
+                new_dependencies.append(dep)
+
+        action.dependencies.extend(new_dependencies)
+        self.logger.info(
+            f"Added dependencies: {action} depends on {', '.join(str(dep) for dep in new_dependencies)}"
+        )
+
     def _on_trigger_fired(self, trigger: BaseTrigger, event_data: Dict[str, Any]) -> None:
         """Callback function called when a trigger fires.
 
@@ -78,21 +124,6 @@ class Workflow:
         self.logger.info(f"Trigger fired: {trigger}")
         self.run(event_data)
 
-    def get_ready_actions(self) -> List[BaseAction]:
-        """Get all actions that are ready to execute.
-
-        Returns:
-            A list of actions that have all dependencies satisfied
-        """
-        # If there are no actions with dependencies, return all pending actions
-        if all(len(action.dependencies) == 0 for action in self.actions.values()):
-            return [action for action in self.actions.values() if action.status == "pending"]
-
-        return [
-            action for action in self.actions.values()
-            if action.status == "pending" and action.can_execute()
-        ]
-
     def run(self, event_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """Run the workflow.
 
@@ -108,6 +139,7 @@ class Workflow:
 
         self.is_running = True
         self.context = {"event_data": event_data or {}}
+        self._failed = []
 
         try:
             # Reset all actions
@@ -116,33 +148,211 @@ class Workflow:
                 action.result = None
                 action.error = None
 
-            # Execute actions in dependency order
-            while True:
-                ready_actions = self.get_ready_actions()
-                if not ready_actions:
-                    # Check if all actions are completed or if some failed
-                    if all(a.status in ["completed", "failed"] for a in self.actions.values()):
-                        break
-                    # If there are no ready actions but some are still pending,
-                    # there might be a circular dependency
-                    if any(a.status == "pending" for a in self.actions.values()):
-                        raise ValueError("Circular dependency detected in workflow")
-                    break
-
-                for action in ready_actions:
-                    try:
-                        self.logger.info(f"Executing action: {action}")
-                        result = action.run(self.context)
-                        self.context[action.id] = result
-                        self.logger.info(f"Action completed: {action}")
-                    except Exception as e:
-                        self.logger.error(f"Action failed: {action}, error: {str(e)}")
-                        # Continue with other actions
+            levels = self.freeze()
+            if self.max_workers == 1:
+                # Run the actions one at a time, in dependency order
+                for level in levels:
+                    for action in level:
+                        if action.can_execute():
+                            self._record_result(action, *self._run_action(action, self.context))
+            else:
+                self._run_concurrently(levels)
 
             return self.context
         finally:
             self.is_running = False
 
+    def _run_concurrently(self, levels: List[List[BaseAction]]) -> None:
+        """Run the actions on a thread pool, each as soon as its dependencies finish.
+
+        Independent branches of the DAG overlap instead of waiting for every
+        action of a level. Actions whose dependencies failed are skipped and
+        stay pending. Results are merged into the context in plan order, not
+        in the order the actions finish, so the context looks the same as
+        after a serial run.
+
+        Args:
+            levels: The actions grouped by level, from freeze()
+        """
+        waiting = dict(self._dependency_counts)
+        ready = [action for action in levels[0] if action.can_execute()] if levels else []
+        running: Dict[Future, BaseAction] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while ready or running:
+                # Each pooled action gets its own snapshot of the context. Cheap
+                # actions, and a lone ready action, run on this thread instead.
+                inline = []
+                for action in ready:
+                    if action.run_inline or (len(ready) == 1 and not running):
+                        inline.append(action)
+                    else:
+                        running[executor.submit(self._run_action, action, dict(self.context))] = action
+                ready = []
+
+                finished = [(action, self._run_action(action, self.context)) for action in inline]
+                if running:
+                    done, _ = wait(running, timeout=0 if finished else None, return_when=FIRST_COMPLETED)
+                    finished.extend((running.pop(future), future.result()) for future in done)
+
+                for action, (succeeded, result) in finished:
+                    self._record_result(action, succeeded, result)
+                    if not succeeded:
+                        continue
+                    for dependent in self._dependents.get(action.id, ()):
+                        waiting[dependent.id] -= 1
+                        if waiting[dependent.id] == 0 and dependent.can_execute():
+                            ready.append(dependent)
+                self._order_context()
+
+    def _order_context(self) -> None:
+        """Reorder the action results in the context to follow the plan.
+
+        Keys that aren't action results, like event_data, stay in front.
+        """
+        positions = self._plan_positions
+        items = sorted(self.context.items(), key=lambda item: positions.get(item[0], -1))
+        self.context.clear()
+        self.context.update(items)
+
+    def _record_result(self, action: BaseAction, succeeded: bool, result: Any) -> None:
+        """Store an action's result in the context, or remember that it failed.
+
+        Args:
+            action: The action that ran
+            succeeded: Whether the action succeeded
+            result: The result of the action
+        """
+        if succeeded:
+            self.context[action.id] = result
+        else:
+            self._failed.append(action)
+
+    def freeze(self) -> List[List[BaseAction]]:
+        """Build the execution plan, or reuse it if the DAG hasn't changed.
+
+        The plan is the execution levels, the dependency counts and dependents
+        of each action, the position of each action in the plan, and each
+        action's owned inputs. It is rebuilt only
+        when actions or dependencies are added, or when reuse_intermediates
+        is changed. Every run calls this; WorkflowRunner also calls it when
+        the workflow is registered, so the first run doesn't build the plan.
+
+        Returns:
+            The actions grouped by level, in execution order
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        key = (
+            tuple(self.actions),
+            tuple(len(a.dependencies) for a in self.actions.values()),
+            self.reuse_intermediates
+        )
+        if self._levels is not None and self._levels_key == key:
+            return self._levels
+
+        # Only dependencies inside the workflow order its actions
+        self._dependency_counts = {
+            action_id: sum(1 for dep in action.dependencies if dep.id in self.actions)
+            for action_id, action in self.actions.items()
+        }
+        self._dependents = {}
+        for action in self.actions.values():
+            for dep in action.dependencies:
+                if dep.id in self.actions:
+                    self._dependents.setdefault(dep.id, []).append(action)
+
+        levels = self._execution_levels()
+        self._plan_positions = {
+            action.id: position
+            for position, action in enumerate(action for level in levels for action in level)
+        }
+        self._assign_owned_inputs()
+
+        self._levels = levels
+        self._levels_key = key
+        return levels
+
+    def _assign_owned_inputs(self) -> None:
+        """Tell each action which dependency results only it reads.
+
+        Chains like dropna -> normalize -> save then pass one DataFrame along
+        instead of copying it at every step.
+        """
+        consumers: Dict[str, int] = {}
+        if self.reuse_intermediates:
+            for action in self.actions.values():
+                for dep in action.dependencies:
+                    consumers[dep.id] = consumers.get(dep.id, 0) + 1
+
+        # Only an action with a single dependency is sure to read its input
+        # from that dependency's result
+        for action in self.actions.values():
+            action.owned_inputs = frozenset(
+                dep.id for dep in action.dependencies
+                if len(action.dependencies) == 1 and consumers.get(dep.id) == 1
+            )
+
+    def _execution_levels(self) -> List[List[BaseAction]]:
+        """Group the actions into levels that can run once the previous ones finish.
+
+        The levels are computed with Kahn's algorithm from the dependency
+        counts and dependents built by freeze().
+
+        Returns:
+            The actions grouped by level, in execution order
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        waiting = dict(self._dependency_counts)
+
+        levels = []
+        level = [action for action in self.actions.values() if waiting[action.id] == 0]
+        while level:
+            levels.append(level)
+            next_level = []
+            for action in level:
+                for dependent in self._dependents.get(action.id, ()):
+                    waiting[dependent.id] -= 1
+                    if waiting[dependent.id] == 0:
+                        next_level.append(dependent)
+            level = next_level
+
+        if sum(len(level) for level in levels) != len(self.actions):
+            raise ValueError("Circular dependency detected in workflow")
+
+        return levels
+
+    def failed_actions(self) -> List[BaseAction]:
+        """Get the actions that failed during the last run.
+
+        Returns:
+            The failed actions, in the order they were executed
+        """
+        return list(self._failed)
+
+    def _run_action(self, action: BaseAction, context: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Run a single action, logging its outcome.
+
+        Args:
+            action: The action to run
+            context: The execution context to pass to the action
+
+        Returns:
+            A (succeeded, result) tuple
+        """
+        try:
+            self.logger.info(f"Executing action: {action}")
+            result = action.run(context)
+            self.logger.info(f"Action completed: {action}")
+            return True, result
+        except Exception as e:
+            self.logger.error(f"Action failed: {action}, error: {str(e)}")
+            # Continue with other actions
+            return False, None
+
     def activate(self) -> None:
         """Activate all triggers in this workflow."""
         for trigger in self.triggers:
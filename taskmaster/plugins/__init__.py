@@ -5,9 +5,10 @@ This package contains the plugin system for TaskMasterPy, allowing
 for extension of the framework with custom triggers and actions.
 """
 
-from taskmaster.plugins.loader import load_plugins, load_plugins_from_entry_points
+from taskmaster.plugins.loader import load_plugins, load_plugins_from_entry_points, invalidate_plugin_cache
 
 __all__ = [
     'load_plugins',
     'load_plugins_from_entry_points',
+    'invalidate_plugin_cache',
 ]
\ No newline at end of file
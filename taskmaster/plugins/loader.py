@@ -6,25 +6,61 @@ This module provides utilities for loading plugins.
 import os
 import sys
 import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
 import inspect
-from typing import Dict, Any, List, Tuple, Optional, Union, Type
+import threading
+from types import MappingProxyType, ModuleType
+from typing import Dict, Any, List, Mapping, Tuple, Optional, Union, Type
 
 from taskmaster.triggers.base import BaseTrigger
 from taskmaster.actions.base import BaseAction
 
 
-class PluginRegistry:
-    """Registry for TaskMasterPy plugins."""
+# Entry points of the plugin groups, discovered once per process
+_ENTRY_POINT_GROUPS = ("taskmaster.triggers", "taskmaster.actions")
+_entry_point_cache: Optional[Dict[str, Tuple[Any, ...]]] = None
+_entry_point_lock = threading.Lock()
+
+# Plugin module names per plugin directory, with the directory's mtime
+_plugin_module_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+# Import hooks for lazily loaded plugin directories, and the lazy modules
+# that haven't been executed yet
+_plugin_finders: Dict[str, "_PluginFinder"] = {}
+_pending_plugin_modules: List[ModuleType] = []
+_pending_lock = threading.Lock()
+
+
+# Registered plugin classes, by name
+_TRIGGERS: Dict[str, Type[BaseTrigger]] = {}
+_ACTIONS: Dict[str, Type[BaseAction]] = {}
+_TRIGGERS_VIEW: Mapping[str, Type[BaseTrigger]] = MappingProxyType(_TRIGGERS)
+_ACTIONS_VIEW: Mapping[str, Type[BaseAction]] = MappingProxyType(_ACTIONS)
+
+
+def _add_trigger(name: str, trigger_class: Type[BaseTrigger]) -> None:
+    """Validate a trigger class and add it to the registry."""
+    if not issubclass(trigger_class, BaseTrigger):
+        raise TypeError(f"Trigger class must inherit from BaseTrigger: {trigger_class}")
     
-    _instance = None
+    _TRIGGERS[name] = trigger_class
+
+
+def _add_action(name: str, action_class: Type[BaseAction]) -> None:
+    """Validate an action class and add it to the registry."""
+    if not issubclass(action_class, BaseAction):
+        raise TypeError(f"Action class must inherit from BaseAction: {action_class}")
     
-    def __new__(cls):
-        """Create a singleton instance."""
-        if cls._instance is None:
-            cls._instance = super(PluginRegistry, cls).__new__(cls)
-            cls._instance._triggers = {}
-            cls._instance._actions = {}
-        return cls._instance
+    _ACTIONS[name] = action_class
+
+
+class PluginRegistry:
+    """Registry for TaskMasterPy plugins.
+    
+    All instances share the module-level plugin tables.
+    """
     
     def register_trigger(self, name: str, trigger_class: Type[BaseTrigger]) -> None:
         """Register a trigger plugin.
@@ -33,10 +69,7 @@ class PluginRegistry:
             name: The name of the trigger
             trigger_class: The trigger class
         """
-        if not issubclass(trigger_class, BaseTrigger):
-            raise TypeError(f"Trigger class must inherit from BaseTrigger: {trigger_class}")
-        
-        self._triggers[name] = trigger_class
+        _add_trigger(name, trigger_class)
     
     def register_action(self, name: str, action_class: Type[BaseAction]) -> None:
         """Register an action plugin.
@@ -45,10 +78,7 @@ class PluginRegistry:
             name: The name of the action
             action_class: The action class
         """
-        if not issubclass(action_class, BaseAction):
-            raise TypeError(f"Action class must inherit from BaseAction: {action_class}")
-        
-        self._actions[name] = action_class
+        _add_action(name, action_class)
     
     def get_trigger(self, name: str) -> Optional[Type[BaseTrigger]]:
         """Get a registered trigger plugin.
@@ -59,7 +89,11 @@ class PluginRegistry:
         Returns:
             The trigger class, or None if not found
         """
-        return self._triggers.get(name)
+        trigger_class = _TRIGGERS.get(name)
+        if trigger_class is None and _pending_plugin_modules:
+            _load_pending_plugins()
+            trigger_class = _TRIGGERS.get(name)
+        return trigger_class
     
     def get_action(self, name: str) -> Optional[Type[BaseAction]]:
         """Get a registered action plugin.
@@ -70,23 +104,29 @@ class PluginRegistry:
         Returns:
             The action class, or None if not found
         """
-        return self._actions.get(name)
+        action_class = _ACTIONS.get(name)
+        if action_class is None and _pending_plugin_modules:
+            _load_pending_plugins()
+            action_class = _ACTIONS.get(name)
+        return action_class
     
-    def get_all_triggers(self) -> Dict[str, Type[BaseTrigger]]:
+    def get_all_triggers(self) -> Mapping[str, Type[BaseTrigger]]:
         """Get all registered trigger plugins.
         
         Returns:
-            A dictionary mapping trigger names to trigger classes
+            A read-only live view mapping trigger names to trigger classes
         """
-        return self._triggers.copy()
+        _load_pending_plugins()
+        return _TRIGGERS_VIEW
     
-    def get_all_actions(self) -> Dict[str, Type[BaseAction]]:
+    def get_all_actions(self) -> Mapping[str, Type[BaseAction]]:
         """Get all registered action plugins.
         
         Returns:
-            A dictionary mapping action names to action classes
+            A read-only live view mapping action names to action classes
         """
-        return self._actions.copy()
+        _load_pending_plugins()
+        return _ACTIONS_VIEW
 
 
 def register_trigger(name: str):
@@ -99,8 +139,7 @@ def register_trigger(name: str):
         A decorator function
     """
     def decorator(cls):
-        registry = PluginRegistry()
-        registry.register_trigger(name, cls)
+        _add_trigger(name, cls)
         return cls
     return decorator
 
@@ -115,59 +154,220 @@ def register_action(name: str):
         A decorator function
     """
     def decorator(cls):
-        registry = PluginRegistry()
-        registry.register_action(name, cls)
+        _add_action(name, cls)
         return cls
     return decorator
 
 
-def load_plugins(plugin_dir: str) -> None:
+def load_plugins(plugin_dir: str, lazy: bool = False) -> None:
     """Load plugins from a directory.
     
+    With lazy loading, each plugin module is imported as a lazy module and
+    only executed when the registry is asked for a plugin it doesn't know
+    yet, so unused plugin directories cost little more than a directory scan.
+    
     Args:
         plugin_dir: Path to the plugin directory
+        lazy: Whether to defer executing the plugin modules
     """
     # Check if the directory exists
-    if not os.path.exists(plugin_dir):
+    module_names = _list_plugin_modules(plugin_dir)
+    if module_names is None:
         return
     
-    # Add the plugin directory to the Python path
-    sys.path.insert(0, plugin_dir)
+    # Plugin modules are found by an import hook for the directory rather
+    # than through sys.path, which stays untouched
+    finder = _install_plugin_finder(plugin_dir, module_names, lazy=lazy)
     
-    # Load all Python files in the directory
-    for file in os.listdir(plugin_dir):
-        if file.endswith(".py") and not file.startswith("__"):
-            module_name = file[:-3]  # Remove .py extension
+    try:
+        # Load all Python files in the directory
+        for module_name in module_names:
             try:
-                importlib.import_module(module_name)
+                module = importlib.import_module(module_name)
             except Exception as e:
                 print(f"Error loading plugin {module_name}: {str(e)}")
+            else:
+                if lazy:
+                    with _pending_lock:
+                        _pending_plugin_modules.append(module)
+    finally:
+        _release_plugin_finder(plugin_dir, finder)
+
+
+def _list_plugin_modules(plugin_dir: str) -> Optional[List[str]]:
+    """List the plugin modules in a directory.
+    
+    The listing is cached per directory and reused until the directory's
+    modification time changes, which happens whenever a file is added,
+    removed or renamed in it.
+    
+    Args:
+        plugin_dir: Path to the plugin directory
+        
+    Returns:
+        The module names, or None if the directory doesn't exist
+    """
+    try:
+        mtime_ns = os.stat(plugin_dir).st_mtime_ns
+    except OSError:
+        return None
+    
+    cached = _plugin_module_cache.get(plugin_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    module_names = []
+    with os.scandir(plugin_dir) as it:
+        for entry in it:
+            # Name checks first; is_file() uses the d_type from the scan
+            name = entry.name
+            if name[-3:] == ".py" and name[:2] != "__" and entry.is_file():
+                module_names.append(name[:-3])  # Remove .py extension
+    
+    _plugin_module_cache[plugin_dir] = (mtime_ns, module_names)
+    return module_names
+
+
+class _PluginFinder(importlib.abc.MetaPathFinder):
+    """Import hook that finds top-level plugin modules in a plugin directory."""
+    
+    def __init__(self, plugin_dir: str, module_names: List[str], lazy: bool):
+        self._finder = importlib.machinery.FileFinder(
+            plugin_dir,
+            (importlib.machinery.SourceFileLoader, importlib.machinery.SOURCE_SUFFIXES)
+        )
+        self.module_names = frozenset(module_names)
+        self.lazy = lazy
+    
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if path is not None or fullname not in self.module_names:
+            return None
+        
+        spec = self._finder.find_spec(fullname, target)
+        if spec is not None and self.lazy:
+            spec.loader = importlib.util.LazyLoader(spec.loader)
+        return spec
+
+
+def _install_plugin_finder(plugin_dir: str, module_names: List[str], lazy: bool) -> "_PluginFinder":
+    """Install the import hook for a plugin directory ahead of the default ones.
+    
+    Like the plugin directory being first on sys.path, the directory's
+    modules take precedence while its plugins are loaded.
+    
+    Args:
+        plugin_dir: Path to the plugin directory
+        module_names: The plugin modules in the directory
+        lazy: Whether found modules should be loaded lazily
+        
+    Returns:
+        The import hook for the directory
+    """
+    finder = _plugin_finders.pop(plugin_dir, None)
+    if finder is None:
+        finder = _PluginFinder(plugin_dir, module_names, lazy)
+    else:
+        finder.module_names = frozenset(module_names)
+        finder.lazy = lazy
+        if finder in sys.meta_path:
+            sys.meta_path.remove(finder)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def _release_plugin_finder(plugin_dir: str, finder: "_PluginFinder") -> None:
+    """Stop the import hook of a plugin directory from shadowing other modules.
     
-    # Remove the plugin directory from the Python path
-    sys.path.pop(0)
+    An eagerly loaded directory's hook is removed. A lazily loaded one is
+    kept after the default finders, for plugin modules that import each
+    other when they are executed later, but no longer hides installed
+    modules of the same name.
+    
+    Args:
+        plugin_dir: Path to the plugin directory
+        finder: The import hook installed for the directory
+    """
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
+    if finder.lazy:
+        _plugin_finders[plugin_dir] = finder
+        sys.meta_path.append(finder)
+
+
+def _load_pending_plugins() -> None:
+    """Execute the lazily imported plugin modules that haven't run yet."""
+    with _pending_lock:
+        modules = _pending_plugin_modules[:]
+        del _pending_plugin_modules[:]
+    
+    for module in modules:
+        try:
+            # Any attribute access runs a lazy module's code
+            getattr(module, "__doc__", None)
+        except Exception as e:
+            print(f"Error loading plugin {module.__spec__.name}: {str(e)}")
 
 
 def load_plugins_from_entry_points() -> None:
     """Load plugins from entry points."""
-    try:
-        import pkg_resources
-    except ImportError:
-        return
+    entry_points = _get_plugin_entry_points()
     
     # Load trigger plugins
-    for entry_point in pkg_resources.iter_entry_points("taskmaster.triggers"):
+    for entry_point in entry_points["taskmaster.triggers"]:
         try:
             trigger_class = entry_point.load()
-            registry = PluginRegistry()
-            registry.register_trigger(entry_point.name, trigger_class)
+            _add_trigger(entry_point.name, trigger_class)
         except Exception as e:
             print(f"Error loading trigger plugin {entry_point.name}: {str(e)}")
     
     # Load action plugins
-    for entry_point in pkg_resources.iter_entry_points("taskmaster.actions"):
+    for entry_point in entry_points["taskmaster.actions"]:
         try:
             action_class = entry_point.load()
-            registry = PluginRegistry()
-            registry.register_action(entry_point.name, action_class)
+            _add_action(entry_point.name, action_class)
         except Exception as e:
             print(f"Error loading action plugin {entry_point.name}: {str(e)}")
+
+
+def invalidate_plugin_cache() -> None:
+    """Forget the cached entry points, e.g. after installing a plugin package."""
+    global _entry_point_cache
+    with _entry_point_lock:
+        _entry_point_cache = None
+
+
+def _get_plugin_entry_points() -> Dict[str, Tuple[Any, ...]]:
+    """Get the entry points of the plugin groups, discovering them on first use.
+    
+    importlib.metadata reads the metadata of every installed distribution on
+    each entry_points() call, so the result is cached.
+    
+    Returns:
+        A dictionary mapping each plugin group to its entry points
+    """
+    global _entry_point_cache
+    with _entry_point_lock:
+        if _entry_point_cache is None:
+            from importlib.metadata import entry_points
+            
+            eps = entry_points()
+            _entry_point_cache = {
+                group: _select_entry_points(eps, group) for group in _ENTRY_POINT_GROUPS
+            }
+        return _entry_point_cache
+
+
+def _select_entry_points(eps: Any, group: str) -> Tuple[Any, ...]:
+    """Get the entry points of a group.
+    
+    Args:
+        eps: The result of importlib.metadata.entry_points()
+        group: The entry point group
+        
+    Returns:
+        The entry points in the group
+    """
+    # Python 3.10+ returns an EntryPoints object, older versions a dict of lists
+    if hasattr(eps, "select"):
+        return tuple(eps.select(group=group))
+    return tuple(eps.get(group, ()))
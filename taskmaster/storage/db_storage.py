@@ -4,14 +4,38 @@ Database storage for TaskMasterPy workflows.
 This module provides a database-backed storage implementation for workflows.
 """
 import os
-import json
 import sqlite3
+import threading
 import yaml
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 import logging
 
 from taskmaster.core.workflow import Workflow
 from taskmaster.utils.config import load_workflow_from_config
+from taskmaster.utils.serialization import json_dumps, json_loads
+
+# Connection settings: WAL lets readers run alongside a writer, and with
+# synchronous=NORMAL a commit no longer waits for an fsync of the database
+_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+"""
+
+# libyaml-backed parser and emitter when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_UPSERT_WORKFLOW = """
+INSERT INTO workflows (id, name, description, config)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name,
+    description = excluded.description,
+    config = excluded.config,
+    updated_at = CURRENT_TIMESTAMP
+"""
 
 
 class WorkflowStorage:
@@ -38,31 +62,43 @@ class WorkflowStorage:
         self.db_path = db_path
         self.logger = logging.getLogger("taskmaster.storage")
         
+        # One connection is shared by all operations; the lock serializes them
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        
         # Initialize the database
         self._init_db()
     
     def _init_db(self) -> None:
-        """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create the workflows table if it doesn't exist
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS workflows (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            description TEXT,
-            config TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        conn.commit()
-        conn.close()
+        """Initialize the connection settings and the database schema."""
+        with self._lock:
+            self._conn.executescript(_PRAGMAS)
+            
+            with self._conn:
+                # Create the workflows table if it doesn't exist
+                self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS workflows (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    config TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """)
+                
+                # list_workflows orders by name
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_workflows_name ON workflows(name)"
+                )
         
         self.logger.info(f"Initialized workflow database at {self.db_path}")
     
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
     def save_workflow(self, workflow_id: str, config: Dict[str, Any]) -> None:
         """Save a workflow configuration to the database.
         
@@ -70,44 +106,29 @@ class WorkflowStorage:
             workflow_id: The ID of the workflow
             config: The workflow configuration as a dictionary
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Check if the workflow already exists
-        cursor.execute("SELECT id FROM workflows WHERE id = ?", (workflow_id,))
-        exists = cursor.fetchone() is not None
+        self.save_workflows([(workflow_id, config)])
+        self.logger.info(f"Saved workflow {workflow_id} to database")
+    
+    def save_workflows(self, workflows: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Save several workflow configurations in a single transaction.
         
-        # Convert the config to JSON
-        config_json = json.dumps(config)
+        Workflows that already exist are updated.
         
-        if exists:
-            # Update the existing workflow
-            cursor.execute("""
-            UPDATE workflows
-            SET name = ?, description = ?, config = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """, (
-                config.get("name", ""),
-                config.get("description", ""),
-                config_json,
-                workflow_id
-            ))
-            self.logger.info(f"Updated workflow {workflow_id} in database")
-        else:
-            # Insert a new workflow
-            cursor.execute("""
-            INSERT INTO workflows (id, name, description, config)
-            VALUES (?, ?, ?, ?)
-            """, (
+        Args:
+            workflows: (workflow ID, configuration) pairs
+        """
+        rows = [
+            (
                 workflow_id,
                 config.get("name", ""),
                 config.get("description", ""),
-                config_json
-            ))
-            self.logger.info(f"Saved workflow {workflow_id} to database")
+                json_dumps(config).decode("utf-8")
+            )
+            for workflow_id, config in workflows
+        ]
         
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT_WORKFLOW, rows)
     
     def load_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Load a workflow configuration from the database.
@@ -118,16 +139,13 @@ class WorkflowStorage:
         Returns:
             The workflow configuration as a dictionary, or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT config FROM workflows WHERE id = ?", (workflow_id,))
-        result = cursor.fetchone()
-        
-        conn.close()
+        with self._lock:
+            result = self._conn.execute(
+                "SELECT config FROM workflows WHERE id = ?", (workflow_id,)
+            ).fetchone()
         
         if result:
-            config = json.loads(result[0])
+            config = json_loads(result[0])
             self.logger.info(f"Loaded workflow {workflow_id} from database")
             return config
         
@@ -143,14 +161,9 @@ class WorkflowStorage:
         Returns:
             True if the workflow was deleted, False if it wasn't found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM workflows WHERE id = ?", (workflow_id,))
-        deleted = cursor.rowcount > 0
-        
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM workflows WHERE id = ?", (workflow_id,))
+            deleted = cursor.rowcount > 0
         
         if deleted:
             self.logger.info(f"Deleted workflow {workflow_id} from database")
@@ -165,17 +178,15 @@ class WorkflowStorage:
         Returns:
             A list of workflow metadata dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        SELECT id, name, description, created_at, updated_at
-        FROM workflows
-        ORDER BY name
-        """)
+        with self._lock:
+            rows = self._conn.execute("""
+            SELECT id, name, description, created_at, updated_at
+            FROM workflows
+            ORDER BY name
+            """).fetchall()
         
         workflows = []
-        for row in cursor.fetchall():
+        for row in rows:
             workflows.append({
                 "id": row[0],
                 "name": row[1],
@@ -184,8 +195,6 @@ class WorkflowStorage:
                 "updated_at": row[4]
             })
         
-        conn.close()
-        
         self.logger.info(f"Listed {len(workflows)} workflows from database")
         return workflows
     
@@ -199,11 +208,11 @@ class WorkflowStorage:
             The ID of the imported workflow
         """
         # Load the workflow configuration
-        with open(file_path, "r") as f:
+        with open(file_path, "rb") as f:
             if file_path.endswith((".yaml", ".yml")):
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
             elif file_path.endswith(".json"):
-                config = json.load(f)
+                config = json_loads(f.read())
             else:
                 raise ValueError(f"Unsupported file format: {file_path}")
         
@@ -235,13 +244,14 @@ class WorkflowStorage:
             return False
         
         # Save the configuration to a file
-        with open(file_path, "w") as f:
-            if file_path.endswith((".yaml", ".yml")):
-                yaml.dump(config, f, default_flow_style=False)
-            elif file_path.endswith(".json"):
-                json.dump(config, f, indent=2)
-            else:
-                raise ValueError(f"Unsupported file format: {file_path}")
+        if file_path.endswith((".yaml", ".yml")):
+            with open(file_path, "w") as f:
+                yaml.dump(config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
+        elif file_path.endswith(".json"):
+            with open(file_path, "wb") as f:
+                f.write(json_dumps(config, indent=True))
+        else:
+            raise ValueError(f"Unsupported file format: {file_path}")
         
         self.logger.info(f"Exported workflow {workflow_id} to {file_path}")
         return True
@@ -3,16 +3,107 @@ API-based triggers for TaskMasterPy.
 
 This module defines triggers that fire based on API polling or webhooks.
 """
+import functools
+import heapq
+import itertools
+import queue
 import threading
 import time
 import json
-import hashlib
-from typing import Dict, Any, Optional, List, Callable
-import requests
+from hashlib import blake2b
+from typing import Dict, Any, Optional, List, Callable, Tuple
 
 from taskmaster.triggers.base import BaseTrigger
 
 
+@functools.lru_cache(maxsize=None)
+def _requests() -> Any:
+    """Import the requests module on first use."""
+    import requests
+    return requests
+
+
+@functools.lru_cache(maxsize=None)
+def _jmespath() -> Any:
+    """Import the jmespath module on first use."""
+    import jmespath
+    return jmespath
+
+
+class _HashWriter:
+    """A file-like adapter that feeds written text into a hash object."""
+    
+    def __init__(self, hasher: Any):
+        self.hasher = hasher
+    
+    def write(self, s: str) -> None:
+        self.hasher.update(s.encode("ascii"))
+
+
+class _PollScheduler:
+    """Runs the polls of all API poll triggers on a few shared threads.
+    
+    One scheduler thread keeps a heap of due times and hands due polls to a
+    small pool of worker threads, so idle triggers don't each hold a thread.
+    A trigger is rescheduled only after its poll finishes, so its polls
+    never overlap. Workers only poll; triggers that fire run their
+    workflows on threads of their own.
+    """
+    
+    def __init__(self, workers: int = 8):
+        self._workers = workers
+        self._heap: List[Tuple[float, int, "APIPollTrigger", int]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._queue: "queue.Queue[Tuple[APIPollTrigger, int]]" = queue.Queue()
+        self._started = False
+    
+    def schedule(self, trigger: "APIPollTrigger", generation: int, delay: float = 0) -> None:
+        """Schedule a poll of a trigger.
+        
+        Args:
+            trigger: The trigger to poll
+            generation: The trigger's activation generation; polls from an
+                older activation are dropped
+            delay: Seconds to wait before polling
+        """
+        with self._condition:
+            if not self._started:
+                self._start()
+            entry = (time.monotonic() + delay, next(self._counter), trigger, generation)
+            heapq.heappush(self._heap, entry)
+            if self._heap[0] is entry:
+                self._condition.notify()
+    
+    def _start(self) -> None:
+        threading.Thread(target=self._run_scheduler, daemon=True).start()
+        for _ in range(self._workers):
+            threading.Thread(target=self._run_worker, daemon=True).start()
+        self._started = True
+    
+    def _run_scheduler(self) -> None:
+        """Hand due polls to the workers, sleeping until the next one is due."""
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                _, _, trigger, generation = heapq.heappop(self._heap)
+            self._queue.put((trigger, generation))
+    
+    def _run_worker(self) -> None:
+        """Run due polls."""
+        while True:
+            trigger, generation = self._queue.get()
+            trigger._poll(generation)
+
+
+_poll_scheduler = _PollScheduler()
+
+
 class APIPollTrigger(BaseTrigger):
     """A trigger that fires based on polling an API endpoint.
     
@@ -48,65 +139,125 @@ class APIPollTrigger(BaseTrigger):
         self.condition_value = self.config.get("condition_value", None)
         self.jmespath_expression = self.config.get("jmespath_expression", None)
         
-        self.thread: Optional[threading.Thread] = None
+        # Compile the JMESPath expression once, so syntax errors show up here
+        self._jmespath_compiled: Any = None
+        if self.trigger_condition == "jmespath" and self.jmespath_expression:
+            try:
+                self._jmespath_compiled = _jmespath().compile(self.jmespath_expression)
+            except ImportError:
+                pass  # Reported when the trigger polls
+        
+        self._generation = 0
+        self._session: Any = None
         self.last_response: Any = None
         self.last_response_hash: Optional[str] = None
+        self._last_etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
     
     def activate(self) -> None:
         """Activate the trigger to start polling the API."""
         super().activate()
         
-        # Start the polling thread
-        self.thread = threading.Thread(target=self._poll_api, daemon=True)
-        self.thread.start()
+        # Start polling on the shared poll threads
+        self._generation += 1
+        _poll_scheduler.schedule(self, self._generation)
     
     def deactivate(self) -> None:
         """Deactivate the trigger to stop polling the API."""
         self.is_active = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
-            self.thread = None
     
-    def _poll_api(self) -> None:
-        """Poll the API endpoint periodically."""
-        while self.is_active:
-            try:
-                # Make the API request
-                response = requests.request(
-                    method=self.method,
-                    url=self.url,
-                    headers=self.headers,
-                    data=self.data,
-                    timeout=30
-                )
-                
-                # Parse the response based on the specified type
-                if self.response_type == "json":
-                    response_data = response.json()
-                elif self.response_type == "text":
-                    response_data = response.text
-                else:  # binary
-                    response_data = response.content
-                
-                # Check if we should fire the trigger
-                if self._should_fire(response_data):
-                    self.fire({
-                        "url": self.url,
-                        "response": response_data,
-                        "status_code": response.status_code,
-                        "time": time.time()
-                    })
-                
-                # Update the last response
-                self.last_response = response_data
-                self.last_response_hash = self._hash_response(response_data)
-                
-            except Exception as e:
-                # Log the error but continue polling
-                print(f"Error polling API {self.url}: {str(e)}")
+    def _poll(self, generation: int) -> None:
+        """Poll the API endpoint once and schedule the next poll.
+        
+        Args:
+            generation: The activation generation the poll was scheduled for
+        """
+        if not self.is_active or generation != self._generation:
+            # Deactivated (or reactivated) since this poll was scheduled
+            if self._session is not None and not self.is_active:
+                self._session.close()
+                self._session = None
+            return
+        
+        try:
+            # Reuse one session so keep-alive connections survive between polls
+            if self._session is None:
+                self._session = _requests().Session()
+            
+            # Make the API request
+            response = self._session.request(
+                method=self.method,
+                url=self.url,
+                headers=self._request_headers(),
+                data=self.data,
+                timeout=30
+            )
             
-            # Sleep until the next poll
-            time.sleep(self.interval)
+            # 304 means nothing changed, so there is nothing to parse or hash
+            if response.status_code != 304:
+                self._handle_response(response)
+            
+        except Exception as e:
+            # Log the error but continue polling
+            print(f"Error polling API {self.url}: {str(e)}")
+        
+        # Schedule the next poll
+        _poll_scheduler.schedule(self, generation, self.interval)
+    
+    def _request_headers(self) -> Dict[str, Any]:
+        """Get the headers for the next poll.
+        
+        For the any_change condition, the validators of the last response are
+        sent so the server can answer 304 Not Modified instead of the body.
+        
+        Returns:
+            The request headers
+        """
+        if self._last_etag is None and self._last_modified is None:
+            return self.headers
+        
+        headers = dict(self.headers)
+        if self._last_etag is not None:
+            headers["If-None-Match"] = self._last_etag
+        if self._last_modified is not None:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+    
+    def _handle_response(self, response: Any) -> None:
+        """Parse a poll response, fire if needed and remember it.
+        
+        Args:
+            response: The HTTP response
+        """
+        # Imported here, as taskmaster.utils imports the core package
+        from taskmaster.utils.serialization import json_loads
+        
+        # Parse the response based on the specified type
+        if self.response_type == "json":
+            response_data = json_loads(response.content)
+        elif self.response_type == "text":
+            response_data = response.text
+        else:  # binary
+            response_data = response.content
+        
+        # Check if we should fire the trigger
+        if self._should_fire(response_data):
+            self._fire_in_background({
+                "url": self.url,
+                "response": response_data,
+                "status_code": response.status_code,
+                "time": time.time()
+            })
+        
+        # Update the last response
+        self.last_response = response_data
+        if self.trigger_condition == "any_change":
+            self.last_response_hash = self._hash_response(response_data)
+            self._last_etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+        else:
+            # Only the any_change condition compares hashes
+            self.last_response_hash = None
     
     def _should_fire(self, response_data: Any) -> bool:
         """Check if the trigger should fire based on the response.
@@ -130,8 +281,9 @@ class APIPollTrigger(BaseTrigger):
             # Fire if the JMESPath expression evaluates to a truthy value
             if self.jmespath_expression:
                 try:
-                    import jmespath
-                    result = jmespath.search(self.jmespath_expression, response_data)
+                    if self._jmespath_compiled is None:
+                        self._jmespath_compiled = _jmespath().compile(self.jmespath_expression)
+                    result = self._jmespath_compiled.search(response_data)
                     return bool(result)
                 except ImportError:
                     print("jmespath library not installed, falling back to any_change")
@@ -152,14 +304,20 @@ class APIPollTrigger(BaseTrigger):
         Returns:
             A hash of the response data
         """
-        if isinstance(response_data, (dict, list)):
-            # For structured data, hash the JSON string
-            data_str = json.dumps(response_data, sort_keys=True)
+        from taskmaster.utils.serialization import HAS_ORJSON, json_dumps
+        
+        hasher = blake2b(digest_size=16)
+        if isinstance(response_data, (dict, list)) and HAS_ORJSON:
+            # orjson encodes straight to bytes
+            hasher.update(json_dumps(response_data, sort_keys=True))
+        elif isinstance(response_data, (dict, list)):
+            # For structured data, feed the JSON encoding straight into the hash
+            json.dump(response_data, _HashWriter(hasher), sort_keys=True, ensure_ascii=True)
         elif isinstance(response_data, bytes):
             # For binary data, hash the bytes directly
-            return hashlib.md5(response_data).hexdigest()
+            hasher.update(response_data)
         else:
             # For text, hash the string
-            data_str = str(response_data)
+            hasher.update(str(response_data).encode("utf-8"))
         
-        return hashlib.md5(data_str.encode("utf-8")).hexdigest()
+        return hasher.hexdigest()
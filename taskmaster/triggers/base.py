@@ -5,6 +5,7 @@ This module defines the base class for all triggers in the TaskMasterPy framewor
 Triggers are responsible for initiating workflows based on specific events.
 """
 from abc import ABC, abstractmethod
+import threading
 import uuid
 from typing import Dict, Any, Optional, List, Callable
 
@@ -28,6 +29,11 @@ class BaseTrigger(ABC):
         self.config = config or {}
         self.callbacks: List[Callable] = []
         self.is_active = False
+        # The event waiting to be fired in the background, and whether a
+        # fire thread is running
+        self._fire_lock = threading.Lock()
+        self._next_event: Optional[Dict[str, Any]] = None
+        self._firing = False
     
     def register_callback(self, callback: Callable) -> None:
         """Register a callback function to be called when the trigger fires.
@@ -47,6 +53,38 @@ class BaseTrigger(ABC):
         for callback in self.callbacks:
             callback(self, event_data)
     
+    def _fire_in_background(self, event_data: Dict[str, Any]) -> None:
+        """Fire the trigger on a thread of its own.
+        
+        For triggers whose events are detected on threads shared with other
+        triggers, which a workflow run would otherwise hold up. Fires of
+        one trigger still run one at a time; if another event arrives while
+        a fire is running, only the latest event is fired next.
+        
+        Args:
+            event_data: Data associated with the triggering event
+        """
+        with self._fire_lock:
+            self._next_event = event_data
+            if self._firing:
+                return
+            self._firing = True
+        threading.Thread(target=self._run_fires, daemon=True).start()
+    
+    def _run_fires(self) -> None:
+        """Fire the pending events until there are none left."""
+        while True:
+            with self._fire_lock:
+                event_data = self._next_event
+                self._next_event = None
+                if event_data is None:
+                    self._firing = False
+                    return
+            try:
+                self.fire(event_data)
+            except Exception as e:
+                print(f"Error firing trigger {self.name}: {str(e)}")
+    
     @abstractmethod
     def activate(self) -> None:
         """Activate the trigger to start listening for events."""
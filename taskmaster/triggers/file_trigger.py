@@ -39,7 +39,7 @@ class FileEventHandler(FileSystemEventHandler):
             event: The file system event
         """
         if self.trigger.should_process_event(event, "created"):
-            self.trigger.fire({
+            self.trigger.dispatch({
                 "event_type": "created",
                 "path": event.src_path,
                 "is_directory": event.is_directory,
@@ -53,7 +53,7 @@ class FileEventHandler(FileSystemEventHandler):
             event: The file system event
         """
         if self.trigger.should_process_event(event, "modified"):
-            self.trigger.fire({
+            self.trigger.dispatch({
                 "event_type": "modified",
                 "path": event.src_path,
                 "is_directory": event.is_directory,
@@ -67,7 +67,7 @@ class FileEventHandler(FileSystemEventHandler):
             event: The file system event
         """
         if self.trigger.should_process_event(event, "deleted"):
-            self.trigger.fire({
+            self.trigger.dispatch({
                 "event_type": "deleted",
                 "path": event.src_path,
                 "is_directory": event.is_directory,
@@ -81,7 +81,7 @@ class FileEventHandler(FileSystemEventHandler):
             event: The file system event
         """
         if self.trigger.should_process_event(event, "moved"):
-            self.trigger.fire({
+            self.trigger.dispatch({
                 "event_type": "moved",
                 "src_path": event.src_path,
                 "dest_path": event.dest_path,
@@ -110,6 +110,12 @@ class FileTrigger(BaseTrigger):
                 - event_types: List of event types to watch for
                   (created, modified, deleted, moved)
                 - recursive: Whether to watch subdirectories recursively
+                - debounce_interval: Seconds between fired events (default: 0.5)
+                - batch_events: Whether to coalesce bursts of events instead of
+                  dropping them (default: False). Events are collected until none
+                  arrive for debounce_interval seconds, keeping the latest event
+                  per path, and then fired as one event with event_type 'batch',
+                  the affected 'paths' and the individual 'events'.
         """
         if not WATCHDOG_AVAILABLE:
             raise ImportError(
@@ -130,6 +136,10 @@ class FileTrigger(BaseTrigger):
         self.processed_events: Set[str] = set()
         self.last_event_time = 0
         self.debounce_interval = self.config.get("debounce_interval", 0.5)  # seconds
+        self.batch_events = self.config.get("batch_events", False)
+        self._pending_events: Dict[str, Dict[str, Any]] = {}
+        self._batch_timer: Optional[threading.Timer] = None
+        self._batch_lock = threading.Lock()
 
     def activate(self) -> None:
         """Activate the trigger to start watching for file events."""
@@ -156,8 +166,50 @@ class FileTrigger(BaseTrigger):
             self.observer.join()
             self.observer = None
 
+        with self._batch_lock:
+            if self._batch_timer:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+            self._pending_events.clear()
+
         self.is_active = False
 
+    def dispatch(self, event_data: Dict[str, Any]) -> None:
+        """Fire an accepted event, or queue it for the next batch.
+
+        Args:
+            event_data: Data describing the file system event
+        """
+        if not self.batch_events:
+            self.fire(event_data)
+            return
+
+        # Later events for the same path replace earlier ones, and every event
+        # restarts the quiet period (trailing-edge debounce)
+        path = event_data.get("dest_path") or event_data.get("path") or event_data.get("src_path")
+        with self._batch_lock:
+            self._pending_events[path] = event_data
+            if self._batch_timer:
+                self._batch_timer.cancel()
+            self._batch_timer = threading.Timer(self.debounce_interval, self._flush_events)
+            self._batch_timer.daemon = True
+            self._batch_timer.start()
+
+    def _flush_events(self) -> None:
+        """Fire the queued events as one batch event."""
+        with self._batch_lock:
+            events = list(self._pending_events.values())
+            self._pending_events.clear()
+            self._batch_timer = None
+
+        if events:
+            self.fire({
+                "event_type": "batch",
+                "paths": [event.get("dest_path") or event.get("path") for event in events],
+                "events": events,
+                "time": time.time()
+            })
+
     def should_process_event(self, event: FileSystemEvent, event_type: str) -> bool:
         """Check if an event should be processed.
 
@@ -198,6 +250,10 @@ class FileTrigger(BaseTrigger):
         if not matches_pattern:
             return False
 
+        # Bursts are coalesced by dispatch() instead of dropped
+        if self.batch_events:
+            return True
+
         # Debounce events to avoid duplicates
         current_time = time.time()
         event_key = f"{event_type}:{path}:{current_time:.1f}"
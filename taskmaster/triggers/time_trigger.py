@@ -4,13 +4,101 @@ Time-based triggers for TaskMasterPy.
 This module defines triggers that fire based on time, such as at specific
 intervals or at specific times of day.
 """
+import functools
 import threading
 import time
-from typing import Dict, Any, Optional
-import schedule
+from operator import attrgetter
+from typing import Dict, Any, Optional, Tuple
 
 from taskmaster.triggers.base import BaseTrigger
 
+# Longest the scheduler thread sleeps before re-checking for jobs
+_MAX_IDLE_SECONDS = 60
+
+# Accessors for the schedule weekday units, indexed by cron day of week
+_WEEKDAYS = tuple(
+    attrgetter(day)
+    for day in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_cron(expression: str) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """Parse a cron expression into its supported fields.
+    
+    For simplicity, only specific values or '*' are supported, and the
+    month field is ignored. A more complete implementation would handle
+    ranges, lists, and steps.
+    
+    Args:
+        expression: A cron-like expression (e.g., "0 * * * *")
+        
+    Returns:
+        The minute, hour, day of month and day of week, with None for '*'
+    """
+    parts = expression.split()
+    if len(parts) != 5:
+        raise ValueError(f"Invalid cron expression: {expression}")
+    
+    minute, hour, day, month, day_of_week = parts
+    return (
+        _parse_cron_field(minute, "minute"),
+        _parse_cron_field(hour, "hour"),
+        _parse_cron_field(day, "day of month"),
+        _parse_cron_field(day_of_week, "day of week", 0, 6),
+    )
+
+
+def _parse_cron_field(value: str, label: str, low: Optional[int] = None,
+                      high: Optional[int] = None) -> Optional[int]:
+    """Parse a single cron field, returning None for '*'."""
+    if value == "*":
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid {label}: {value}") from None
+    if low is not None and not low <= number <= high:
+        raise ValueError(f"Invalid {label}: {value}")
+    return number
+
+
+@functools.lru_cache(maxsize=None)
+def _schedule() -> Any:
+    """Import the schedule module on first use."""
+    import schedule
+    return schedule
+
+
+# One scheduler thread runs the jobs of all time and cron triggers; the jobs
+# hand the workflow runs to threads of their own
+_scheduler_thread: Optional[threading.Thread] = None
+_scheduler_lock = threading.Lock()
+_scheduler_wakeup = threading.Event()
+
+
+def _wake_scheduler() -> None:
+    """Start the shared scheduler thread, or wake it to pick up a new job."""
+    global _scheduler_thread
+    with _scheduler_lock:
+        if _scheduler_thread is None:
+            _scheduler_thread = threading.Thread(target=_run_scheduler, daemon=True)
+            _scheduler_thread.start()
+    _scheduler_wakeup.set()
+
+
+def _run_scheduler() -> None:
+    """Run pending jobs, sleeping until the next one is due."""
+    schedule = _schedule()
+    while True:
+        _scheduler_wakeup.clear()
+        schedule.run_pending()
+        
+        delay = schedule.idle_seconds()
+        if delay is None:
+            delay = _MAX_IDLE_SECONDS
+        _scheduler_wakeup.wait(max(0, min(delay, _MAX_IDLE_SECONDS)))
+
 
 class TimeTrigger(BaseTrigger):
     """A trigger that fires based on time.
@@ -30,7 +118,6 @@ class TimeTrigger(BaseTrigger):
         """
         super().__init__(name, config)
         self.schedule_str = self.config.get("schedule_str", "every 1 hour")
-        self.thread: Optional[threading.Thread] = None
         self.job = None
     
     def activate(self) -> None:
@@ -50,13 +137,13 @@ class TimeTrigger(BaseTrigger):
                 
                 job = None
                 if unit in ["minute", "minutes"]:
-                    job = schedule.every(interval).minutes
+                    job = _schedule().every(interval).minutes
                 elif unit in ["hour", "hours"]:
-                    job = schedule.every(interval).hours
+                    job = _schedule().every(interval).hours
                 elif unit in ["day", "days"]:
-                    job = schedule.every(interval).days
+                    job = _schedule().every(interval).days
                 elif unit in ["week", "weeks"]:
-                    job = schedule.every(interval).weeks
+                    job = _schedule().every(interval).weeks
                 else:
                     raise ValueError(f"Unsupported time unit: {unit}")
                 
@@ -72,27 +159,21 @@ class TimeTrigger(BaseTrigger):
         else:
             raise ValueError(f"Unsupported schedule format: {self.schedule_str}")
         
-        # Start the scheduler thread
-        self.thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        self.thread.start()
+        # Make sure the shared scheduler thread sees the new job
+        _wake_scheduler()
     
     def deactivate(self) -> None:
         """Deactivate the trigger to stop listening for time events."""
         if self.job:
-            schedule.cancel_job(self.job)
+            _schedule().cancel_job(self.job)
             self.job = None
         
         self.is_active = False
     
     def _on_schedule(self) -> None:
         """Called when the scheduled time is reached."""
-        self.fire({"trigger_time": time.time()})
-    
-    def _run_scheduler(self) -> None:
-        """Run the scheduler loop."""
-        while self.is_active:
-            schedule.run_pending()
-            time.sleep(1)
+        # The shared scheduler thread only schedules; the workflow runs elsewhere
+        self._fire_in_background({"trigger_time": time.time()})
 
 
 class CronTrigger(BaseTrigger):
@@ -111,7 +192,6 @@ class CronTrigger(BaseTrigger):
         """
         super().__init__(name, config)
         self.cron_expression = self.config.get("cron_expression", "0 * * * *")
-        self.thread: Optional[threading.Thread] = None
         self.job = None
     
     def activate(self) -> None:
@@ -121,79 +201,39 @@ class CronTrigger(BaseTrigger):
         # Parse the cron expression and create the appropriate schedule
         # Note: schedule doesn't support full cron expressions, so we'll
         # implement a simplified version
+        minute, hour, day, day_of_week = _parse_cron(self.cron_expression)
         
-        parts = self.cron_expression.split()
-        if len(parts) != 5:
-            raise ValueError(f"Invalid cron expression: {self.cron_expression}")
-        
-        minute, hour, day, month, day_of_week = parts
-        
-        # For simplicity, we'll only support specific values or '*'
-        # A more complete implementation would handle ranges, lists, and steps
-        
-        job = schedule.every()
+        job = _schedule().every()
         
         # Set day of week (0-6, where 0 is Monday)
-        if day_of_week != "*":
-            days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-            try:
-                day_index = int(day_of_week)
-                if day_index < 0 or day_index > 6:
-                    raise ValueError(f"Day of week must be 0-6, got {day_index}")
-                job = getattr(job, days[day_index])
-            except ValueError:
-                raise ValueError(f"Invalid day of week: {day_of_week}")
+        if day_of_week is not None:
+            job = _WEEKDAYS[day_of_week](job)
         
         # Set day of month
-        if day != "*":
-            try:
-                day_num = int(day)
-                job = job.day(day_num)
-            except ValueError:
-                raise ValueError(f"Invalid day of month: {day}")
+        if day is not None:
+            job = job.day(day)
         
-        # Set hour
-        if hour != "*":
-            try:
-                hour_num = int(hour)
-                job = job.at(f"{hour_num:02d}:00")
-            except ValueError:
-                raise ValueError(f"Invalid hour: {hour}")
-        
-        # Set minute
-        if minute != "*":
-            try:
-                minute_num = int(minute)
-                # If hour is specific, we need to adjust the time string
-                if hour != "*":
-                    hour_num = int(hour)
-                    job = job.at(f"{hour_num:02d}:{minute_num:02d}")
-                else:
-                    # If hour is *, we can only specify the minute
-                    job = job.minute(minute_num)
-            except ValueError:
-                raise ValueError(f"Invalid minute: {minute}")
+        # Set hour and minute
+        if hour is not None:
+            job = job.at(f"{hour:02d}:{minute or 0:02d}")
+        elif minute is not None:
+            # If hour is *, we can only specify the minute
+            job = job.minute(minute)
         
         self.job = job.do(self._on_schedule)
         
-        # Start the scheduler thread
-        self.thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        self.thread.start()
+        # Make sure the shared scheduler thread sees the new job
+        _wake_scheduler()
     
     def deactivate(self) -> None:
         """Deactivate the trigger to stop listening for cron events."""
         if self.job:
-            schedule.cancel_job(self.job)
+            _schedule().cancel_job(self.job)
             self.job = None
         
         self.is_active = False
     
     def _on_schedule(self) -> None:
         """Called when the scheduled time is reached."""
-        self.fire({"trigger_time": time.time()})
-    
-    def _run_scheduler(self) -> None:
-        """Run the scheduler loop."""
-        while self.is_active:
-            schedule.run_pending()
-            time.sleep(1)
+        # The shared scheduler thread only schedules; the workflow runs elsewhere
+        self._fire_in_background({"trigger_time": time.time()})
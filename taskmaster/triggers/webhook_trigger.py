@@ -6,16 +6,13 @@ This module defines triggers that fire based on incoming webhook requests.
 import threading
 import time
 import json
-from typing import Dict, Any, Optional, List, Callable, Tuple
+from typing import Dict, Any, Optional, List, Callable, Tuple, TYPE_CHECKING
 import uuid
 
 from taskmaster.triggers.base import BaseTrigger
 
-try:
-    from flask import Flask, request, jsonify
-    FLASK_AVAILABLE = True
-except ImportError:
-    FLASK_AVAILABLE = False
+if TYPE_CHECKING:
+    from flask import Flask
 
 
 class WebhookTrigger(BaseTrigger):
@@ -26,7 +23,7 @@ class WebhookTrigger(BaseTrigger):
     """
     
     # Class-level Flask app and server thread
-    _app: Optional[Flask] = None
+    _app: Optional["Flask"] = None
     _server_thread: Optional[threading.Thread] = None
     _is_server_running = False
     _registered_endpoints: Dict[str, 'WebhookTrigger'] = {}
@@ -36,23 +33,32 @@ class WebhookTrigger(BaseTrigger):
     @classmethod
     def _initialize_server(cls) -> None:
         """Initialize the Flask server if it's not already running."""
-        if not FLASK_AVAILABLE:
-            raise ImportError(
-                "Flask is required for WebhookTrigger. "
-                "Install it with 'pip install flask'."
-            )
-        
         if cls._app is None:
+            try:
+                from flask import Flask, Response, request
+            except ImportError:
+                raise ImportError(
+                    "Flask is required for WebhookTrigger. "
+                    "Install it with 'pip install flask'."
+                )
+            
+            # Imported here, as taskmaster.utils imports the core package
+            from taskmaster.utils.serialization import json_dumps
+            
+            def jsonify(payload: Dict[str, Any]) -> "Response":
+                """Build a JSON response, encoded with orjson when available."""
+                return Response(json_dumps(payload), mimetype="application/json")
+            
             cls._app = Flask("TaskMasterWebhookServer")
+            endpoints = cls._registered_endpoints
             
             @cls._app.route("/<path:endpoint_id>", methods=["GET", "POST", "PUT", "DELETE"])
             def webhook_endpoint(endpoint_id: str) -> Tuple[Dict[str, Any], int]:
                 """Handle incoming webhook requests."""
-                if endpoint_id not in cls._registered_endpoints:
+                trigger = endpoints.get(endpoint_id)
+                if trigger is None:
                     return jsonify({"error": "Endpoint not found"}), 404
                 
-                trigger = cls._registered_endpoints[endpoint_id]
-                
                 # Extract data from the request
                 if request.method in ["POST", "PUT"]:
                     if request.is_json:
@@ -80,13 +86,19 @@ class WebhookTrigger(BaseTrigger):
     
     @classmethod
     def _start_server(cls) -> None:
-        """Start the Flask server in a separate thread."""
+        """Start the webhook server in a separate thread."""
         if cls._is_server_running:
             return
         
         def run_server() -> None:
-            """Run the Flask server."""
-            cls._app.run(host=cls._host, port=cls._port, debug=False, use_reloader=False)
+            """Run the Flask app on waitress, or Flask's own server without it."""
+            try:
+                from waitress import serve
+            except ImportError:
+                cls._app.run(host=cls._host, port=cls._port, debug=False,
+                             use_reloader=False, threaded=True)
+            else:
+                serve(cls._app, host=cls._host, port=cls._port, threads=8)
         
         cls._server_thread = threading.Thread(target=run_server, daemon=True)
         cls._server_thread.start()
@@ -131,8 +143,7 @@ class WebhookTrigger(BaseTrigger):
     
     def deactivate(self) -> None:
         """Deactivate the trigger to stop listening for webhook requests."""
-        if self.endpoint_id in self.__class__._registered_endpoints:
-            del self.__class__._registered_endpoints[self.endpoint_id]
+        self.__class__._registered_endpoints.pop(self.endpoint_id, None)
         
         self.is_active = False
     
@@ -5,13 +5,13 @@ This module provides utilities for loading and parsing configuration files.
 """
 import os
 import yaml
-import json
 from typing import Dict, Any, List, Tuple, Optional, Union
 
 from taskmaster.core.workflow import Workflow
 from taskmaster.triggers.base import BaseTrigger
 from taskmaster.actions.base import BaseAction
 from taskmaster.utils.validators import validate_workflow_config
+from taskmaster.utils.serialization import json_loads
 
 # Import all trigger types
 from taskmaster.triggers.time_trigger import TimeTrigger, CronTrigger
@@ -21,15 +21,22 @@ from taskmaster.triggers.webhook_trigger import WebhookTrigger
 from taskmaster.triggers.db_trigger import DBTrigger, SQLiteDBTrigger
 
 # Import all action types
-from taskmaster.actions.load_data import LoadCSVAction, LoadJSONAction, LoadExcelAction, LoadSQLAction
+from taskmaster.actions.load_data import (
+    LoadCSVAction, LoadJSONAction, LoadExcelAction, LoadParquetAction, LoadSQLAction
+)
 from taskmaster.actions.clean_data import DropNAAction, FixDataTypesAction, RenameColumnsAction, FilterRowsAction
 from taskmaster.actions.transform_data import NormalizeAction, AggregateAction, PivotAction, EncodeAction
-from taskmaster.actions.save_data import SaveCSVAction, SaveJSONAction, SaveExcelAction, SaveSQLAction
+from taskmaster.actions.save_data import (
+    SaveCSVAction, SaveJSONAction, SaveExcelAction, SaveParquetAction, SaveSQLAction
+)
 from taskmaster.actions.email import SendEmailAction
 from taskmaster.actions.api import CallAPIAction, WebhookAction
 from taskmaster.actions.script import RunPythonScriptAction, RunShellScriptAction
 from taskmaster.actions.notify import ConsoleNotifyAction, SystemNotifyAction
 
+# libyaml-backed parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_workflow_config(config_path: str) -> Dict[str, Any]:
     """Load a workflow configuration from a file.
@@ -40,11 +47,11 @@ def load_workflow_config(config_path: str) -> Dict[str, Any]:
     Returns:
         The workflow configuration as a dictionary
     """
-    with open(config_path, "r") as f:
+    with open(config_path, "rb") as f:
         if config_path.endswith((".yaml", ".yml")):
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_LOADER)
         elif config_path.endswith(".json"):
-            return json.load(f)
+            return json_loads(f.read())
         else:
             raise ValueError(f"Unsupported file format: {config_path}")
 
@@ -152,6 +159,8 @@ def create_action_from_config(config: Dict[str, Any]) -> BaseAction:
         return LoadJSONAction(name, action_config)
     elif action_type == "load_excel":
         return LoadExcelAction(name, action_config)
+    elif action_type == "load_parquet":
+        return LoadParquetAction(name, action_config)
     elif action_type == "load_sql":
         return LoadSQLAction(name, action_config)
     elif action_type == "drop_na":
@@ -176,6 +185,8 @@ def create_action_from_config(config: Dict[str, Any]) -> BaseAction:
         return SaveJSONAction(name, action_config)
     elif action_type == "save_excel":
         return SaveExcelAction(name, action_config)
+    elif action_type == "save_parquet":
+        return SaveParquetAction(name, action_config)
     elif action_type == "save_sql":
         return SaveSQLAction(name, action_config)
     elif action_type == "send_email":
@@ -0,0 +1,52 @@
+"""
+Serialization utilities for TaskMasterPy.
+
+This module provides JSON helpers that use orjson when it is installed and
+fall back to the standard library json module otherwise.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Whether json_dumps and json_loads are backed by orjson
+HAS_ORJSON = orjson is not None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: The JSON document, as bytes or text
+
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize
+        indent: Whether to pretty-print with an indent of two spaces
+        sort_keys: Whether to sort the keys of objects
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        # YAML configs can have non-string keys, which stdlib json stringifies
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode("utf-8")
@@ -137,7 +137,7 @@ def validate_action_config(config: Dict[str, Any]) -> List[str]:
     if action_type.startswith("load_"):
         action_config = config.get("config", {})
         
-        if action_type == "load_csv" or action_type == "load_json" or action_type == "load_excel":
+        if action_type in ("load_csv", "load_json", "load_excel", "load_parquet"):
             if "file_path" not in action_config:
                 errors.append(f"{action_type.capitalize()} action requires 'file_path' configuration")
         
@@ -150,7 +150,7 @@ def validate_action_config(config: Dict[str, Any]) -> List[str]:
     elif action_type.startswith("save_"):
         action_config = config.get("config", {})
         
-        if action_type == "save_csv" or action_type == "save_json" or action_type == "save_excel":
+        if action_type in ("save_csv", "save_json", "save_excel", "save_parquet"):
             if "file_path" not in action_config:
                 errors.append(f"{action_type.capitalize()} action requires 'file_path' configuration")
         
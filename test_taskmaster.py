@@ -5,12 +5,20 @@ This script creates a simple workflow and runs it to verify that
 TaskMasterPy is working correctly.
 """
 import os
+import threading
+import time
+from datetime import datetime, timedelta
 import pandas as pd
+import pytest
 from taskmaster.core.workflow import Workflow
 from taskmaster.core.runner import WorkflowRunner
-from taskmaster.actions.load_data import LoadCSVAction
+from taskmaster.actions.base import BaseAction
+from taskmaster.triggers.time_trigger import TimeTrigger, _wake_scheduler
+from taskmaster.cli import commands
+from taskmaster.actions.load_data import LoadCSVAction, LoadParquetAction
 from taskmaster.actions.clean_data import DropNAAction
-from taskmaster.actions.save_data import SaveCSVAction
+from taskmaster.actions.transform_data import AggregateAction, NormalizeAction
+from taskmaster.actions.save_data import SaveCSVAction, SaveParquetAction
 from taskmaster.actions.notify import ConsoleNotifyAction
 
 
@@ -103,5 +111,367 @@ def test_workflow():
         return False
 
 
+class DelayedFrameAction(BaseAction):
+    """Test action that returns a DataFrame after a delay."""
+
+    def execute(self, context=None):
+        time.sleep(self.config.get("delay", 0))
+        return pd.DataFrame({"source": [self.name]})
+
+
+class FailingAction(BaseAction):
+    """Test action that always fails."""
+
+    def execute(self, context=None):
+        raise RuntimeError(f"{self.name} failed")
+
+
+def build_failing_workflow(max_workers):
+    """Create a workflow with two failing branches and one that succeeds."""
+    workflow = Workflow(name="Failure Test", max_workers=max_workers)
+
+    first_failure = FailingAction(name="First Failure")
+    extract = DelayedFrameAction(name="Extract")
+    second_failure = FailingAction(name="Second Failure")
+    skipped = DropNAAction(name="Skipped")
+    cleaned = DropNAAction(name="Cleaned")
+
+    for action in (first_failure, extract, second_failure, skipped, cleaned):
+        workflow.add_action(action)
+    workflow.add_dependency(skipped, first_failure)
+    workflow.add_dependency(second_failure, extract)
+    workflow.add_dependency(cleaned, extract)
+
+    return workflow, first_failure, extract, second_failure, skipped, cleaned
+
+
+def test_failed_dependencies_skip_dependents():
+    """Actions whose dependencies failed don't run, serially or on the pool."""
+    for max_workers in (1, 4):
+        workflow, first_failure, extract, second_failure, skipped, cleaned = \
+            build_failing_workflow(max_workers)
+
+        context = workflow.run()
+
+        assert skipped.status == "pending"
+        assert skipped.id not in context
+        assert cleaned.status == "completed"
+        assert context[cleaned.id]["source"].tolist() == ["Extract"]
+        assert workflow.failed_actions() == [first_failure, second_failure]
+
+
+def test_serial_and_concurrent_runs_match():
+    """A serial run and a pooled run produce the same context."""
+    contexts = []
+    for max_workers in (1, None):
+        workflow, *_ = build_failing_workflow(max_workers)
+        context = workflow.run()
+        contexts.append([
+            (workflow.actions[key].name, value["source"].tolist())
+            for key, value in context.items() if key != "event_data"
+        ])
+
+    assert contexts[0] == contexts[1]
+
+
+def test_circular_dependency_is_rejected():
+    """A cycle in the dependencies is reported when the workflow runs."""
+    workflow = Workflow(name="Cycle Test")
+
+    first = DelayedFrameAction(name="First")
+    second = DelayedFrameAction(name="Second")
+    workflow.add_action(first)
+    workflow.add_action(second)
+    workflow.add_dependency(first, second)
+    workflow.add_dependency(second, first)
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        workflow.run()
+    assert not workflow.is_running
+
+
+def test_concurrent_inputs_follow_dependencies():
+    """Each action gets its own dependency's DataFrame, however fast it finished."""
+    workflow = Workflow(name="Input Order Test", max_workers=2)
+
+    slow_extract = DelayedFrameAction(name="Slow Extract", config={"delay": 0.2})
+    fast_extract = DelayedFrameAction(name="Fast Extract", config={"delay": 0})
+    clean_slow = DropNAAction(name="Clean Slow")
+    clean_fast = DropNAAction(name="Clean Fast")
+
+    for action in (slow_extract, fast_extract, clean_slow, clean_fast):
+        workflow.add_action(action)
+    workflow.add_dependency(clean_slow, slow_extract)
+    workflow.add_dependency(clean_fast, fast_extract)
+
+    context = workflow.run()
+
+    assert context[clean_slow.id]["source"].tolist() == ["Slow Extract"]
+    assert context[clean_fast.id]["source"].tolist() == ["Fast Extract"]
+    # Results are merged in plan order, not in the order the actions finished
+    assert list(context) == [
+        "event_data", slow_extract.id, fast_extract.id, clean_slow.id, clean_fast.id
+    ]
+
+
+def test_reuse_intermediates_only_for_sole_dependency():
+    """Only an action whose single dependency nobody else reads owns its input."""
+    workflow = Workflow(name="Reuse Test", max_workers=1, reuse_intermediates=True)
+
+    first = DelayedFrameAction(name="First")
+    second = DelayedFrameAction(name="Second")
+    chained = DropNAAction(name="Chained")
+    joined = DropNAAction(name="Joined")
+
+    for action in (first, second, chained, joined):
+        workflow.add_action(action)
+    workflow.add_dependency(chained, first)
+    workflow.add_dependencies(joined, [chained, second])
+
+    context = workflow.run()
+
+    assert chained.owns_input(context[first.id], context)
+    # The joined action has two dependencies, so it may read either of them
+    assert not joined.owns_input(context[second.id], context)
+    assert not joined.owns_input(context[chained.id], context)
+
+
+def test_parquet_round_trip(tmp_path):
+    """Data saved as Parquet loads back with the same values and column types."""
+    pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+        "symbol": pd.Categorical(["AAA", "BBB", "AAA"]),
+        "price": pd.Series([1.5, 2.25, 3.0], dtype="float32"),
+        "volume": pd.Series([10, 20, 30], dtype="int32")
+    })
+    file_path = str(tmp_path / "prices.parquet")
+
+    save_action = SaveParquetAction(name="Save Prices", config={"file_path": file_path})
+    assert save_action.execute({"prices": df}) == file_path
+
+    loaded = LoadParquetAction(name="Load Prices", config={"file_path": file_path}).execute()
+    pd.testing.assert_frame_equal(loaded, df)
+
+    subset = LoadParquetAction(
+        name="Load Price Column",
+        config={"file_path": file_path, "columns": ["symbol", "price"]}
+    ).execute()
+    assert list(subset.columns) == ["symbol", "price"]
+    assert subset["price"].dtype == "float32"
+
+
+def create_engine_test_frame():
+    """Create a DataFrame with missing values for the engine parity tests."""
+    return pd.DataFrame({
+        "group": ["a", "b", "a", "c", "b", "a"],
+        "x": [1.0, None, 3.0, 4.0, None, 6.0],
+        "y": [10.0, 20.0, None, 40.0, None, 60.0],
+        "n": [1, 2, 3, 4, 5, 6]
+    })
+
+
+def test_numba_engines_match_pandas():
+    """The numba engines of DropNA and Normalize give the default engines' results."""
+    pytest.importorskip("numba")
+    df = create_engine_test_frame()
+
+    for options in ({}, {"how": "all"}, {"thresh": 3}, {"subset": ["x"]}):
+        expected = DropNAAction(config=options).execute({"df": df})
+        result = DropNAAction(config=dict(options, engine="numba")).execute({"df": df})
+        pd.testing.assert_frame_equal(result, expected)
+
+    config = {"columns": ["x", "y", "n"], "method": "minmax"}
+    expected = NormalizeAction(config=config).execute({"df": df})
+    result = NormalizeAction(config=dict(config, engine="numba")).execute({"df": df})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_polars_engines_match_pandas(tmp_path):
+    """The polars engines of Aggregate and LoadCSV give the pandas engines' results."""
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    df = create_engine_test_frame()
+
+    config = {
+        "group_by": "group",
+        "aggregations": {"x": ["mean", "sum", "last"], "y": "max", "n": ["count", "nunique"]}
+    }
+    expected = AggregateAction(config=config).execute({"df": df})
+    result = AggregateAction(config=dict(config, engine="polars")).execute({"df": df})
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    file_path = str(tmp_path / "engines.csv")
+    df.to_csv(file_path, index=False)
+    expected = LoadCSVAction(config={"file_path": file_path}).execute()
+    result = LoadCSVAction(config={"file_path": file_path, "engine": "polars"}).execute()
+    pd.testing.assert_frame_equal(
+        result.astype(object).where(result.notna(), None),
+        expected.astype(object).where(expected.notna(), None),
+        check_dtype=False
+    )
+
+
+def test_slow_time_trigger_does_not_delay_others():
+    """A long workflow run of one time trigger doesn't hold up the next trigger."""
+    slow_trigger = TimeTrigger(name="Slow Trigger", config={"schedule_str": "every 1 hour"})
+    fast_trigger = TimeTrigger(name="Fast Trigger", config={"schedule_str": "every 1 hour"})
+    release = threading.Event()
+    fast_fired = threading.Event()
+    slow_trigger.register_callback(lambda trigger, event_data: release.wait(5))
+    fast_trigger.register_callback(lambda trigger, event_data: fast_fired.set())
+
+    slow_trigger.activate()
+    fast_trigger.activate()
+    try:
+        # Make both jobs due, the slow one first
+        slow_trigger.job.next_run = datetime.now() - timedelta(seconds=2)
+        fast_trigger.job.next_run = datetime.now() - timedelta(seconds=1)
+        _wake_scheduler()
+
+        assert fast_fired.wait(2)
+    finally:
+        release.set()
+        slow_trigger.deactivate()
+        fast_trigger.deactivate()
+
+
+def test_batched_file_events_load_every_file(tmp_path):
+    """One batched file trigger event loads all of the files it names in one run."""
+    pytest.importorskip("watchdog")
+    from taskmaster.triggers.file_trigger import FileTrigger
+
+    paths = []
+    for i in range(2):
+        path = str(tmp_path / f"part{i}.csv")
+        pd.DataFrame({"id": [2 * i, 2 * i + 1]}).to_csv(path, index=False)
+        paths.append(path)
+
+    trigger = FileTrigger(
+        name="CSV Files",
+        config={"path": str(tmp_path), "batch_events": True, "debounce_interval": 0.05}
+    )
+    load_action = LoadCSVAction(name="Load Event Files", config={"paths_from_event": True})
+    workflow = Workflow(name="Batched Load Workflow")
+    workflow.add_trigger(trigger)
+    workflow.add_action(load_action)
+
+    runs = []
+    trigger.register_callback(lambda trigger, event_data: runs.append(dict(workflow.context)))
+    for path in paths:
+        trigger.dispatch({"event_type": "created", "path": path, "time": time.time()})
+
+    deadline = time.time() + 5
+    while not runs and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)
+
+    assert len(runs) == 1
+    assert runs[0]["event_data"]["paths"] == paths
+    assert list(runs[0][load_action.id]["id"]) == [0, 1, 2, 3]
+
+
+def test_pyarrow_csv_matches_pandas(tmp_path):
+    """The pyarrow CSV writer's files read back like the pandas writer's, index included."""
+    pytest.importorskip("pyarrow")
+
+    sales = pd.DataFrame({
+        "date": ["2024-01-01", "2024-01-01", "2024-01-02"],
+        "category": ["A", "B", "A"],
+        "price": [1.5, 2.0, 3.25]
+    })
+    pivot = sales.pivot_table(
+        index="date", columns="category", values="price", aggfunc="sum", fill_value=0
+    )
+
+    for df, index in ((pivot, True), (sales, True), (sales, False)):
+        files = {}
+        for engine in ("pandas", "pyarrow"):
+            files[engine] = str(tmp_path / f"{engine}.csv")
+            SaveCSVAction(
+                config={"file_path": files[engine], "index": index, "engine": engine}
+            ).execute({"df": df})
+
+        # Arrow writes 2.0 as 2, so only the values are compared
+        pd.testing.assert_frame_equal(
+            pd.read_csv(files["pyarrow"]), pd.read_csv(files["pandas"]), check_dtype=False
+        )
+
+
+WORKFLOW_YAML = """id: "nightly etl"
+name: Nightly ETL
+triggers:
+  - type: time
+    config:
+      schedule_str: every 1 day
+actions:
+  - id: load
+    type: load_csv
+    config:
+      file_path: ./data/test.csv
+"""
+
+
+def test_parsed_workflows_are_cached_on_disk(tmp_path, monkeypatch):
+    """A later invocation reads an unchanged YAML file's parse and validation from the sidecar."""
+    monkeypatch.setattr(commands, "CACHE_DIR", str(tmp_path / "cache"))
+    config_path = tmp_path / "nightly.yaml"
+    config_path.write_text(WORKFLOW_YAML)
+
+    expected = commands.load_and_validate_workflow_config(str(config_path))
+
+    # A new process starts with an empty in-memory cache and must not parse
+    commands._parse_cache.clear()
+    monkeypatch.setattr(commands, "_parse_config_file", pytest.fail)
+    monkeypatch.setattr(commands, "validate_workflow_config", pytest.fail)
+    assert commands.load_and_validate_workflow_config(str(config_path)) == expected
+
+
+def test_workflow_index_is_persisted(tmp_path, monkeypatch):
+    """A later invocation finds workflows without reading unchanged files again."""
+    monkeypatch.setattr(commands, "CACHE_DIR", str(tmp_path / "cache"))
+    config_dir = tmp_path / "workflows"
+    (config_dir / "nested").mkdir(parents=True)
+    (config_dir / "nightly.yaml").write_text(WORKFLOW_YAML)
+    (config_dir / "nested" / "other.json").write_text('{"id": "other", "name": "Other"}')
+
+    index = commands.build_workflow_index(str(config_dir))
+    assert index == {
+        "nightly etl": str(config_dir / "nightly.yaml"),
+        "other": str(config_dir / "nested" / "other.json")
+    }
+    # The index is kept out of the config directory
+    assert sorted(path.name for path in config_dir.iterdir()) == ["nested", "nightly.yaml"]
+
+    commands._parse_cache.clear()
+    monkeypatch.setattr(commands, "_read_workflow_id", pytest.fail)
+    assert commands.build_workflow_index(str(config_dir)) == index
+
+    # An unchanged file is found without scanning the directory
+    monkeypatch.setattr(commands, "iter_workflow_files", pytest.fail)
+    assert commands.find_workflow_file(str(config_dir), "other") == index["other"]
+
+
+def test_workflow_summary_checks_structure(tmp_path):
+    """The listing's cheap check requires a name and non-empty triggers and actions."""
+    cases = {
+        "valid.yaml": (WORKFLOW_YAML, True),
+        "flow.yaml": ("name: Flow\ntriggers: [{type: time}]\nactions:\n  - type: load_csv\n", True),
+        "no_name.yaml": (WORKFLOW_YAML.replace("name: Nightly ETL\n", ""), False),
+        "no_actions.yaml": (WORKFLOW_YAML.split("actions:")[0], False),
+        "empty_triggers.yaml": ("name: Empty\ntriggers: []\nactions:\n  - type: load_csv\n", False),
+        "mapping_actions.yaml": ("name: Map\ntriggers:\n  - type: time\nactions:\n  load: {}\n", False),
+        "valid.json": ('{"name": "J", "triggers": [{"type": "time"}], "actions": [{"type": "load_csv"}]}', True),
+        "empty.json": ('{"name": "J", "triggers": [], "actions": [{"type": "load_csv"}]}', False)
+    }
+    for file_name, (text, expected) in cases.items():
+        config_path = tmp_path / file_name
+        config_path.write_text(text)
+        header, has_structure = commands.read_workflow_summary(str(config_path))
+        assert has_structure is expected, file_name
+        assert header == commands.read_workflow_header(str(config_path))
+
+
 if __name__ == "__main__":
     test_workflow()